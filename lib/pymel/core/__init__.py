@@ -51,10 +51,33 @@ def _pluginUnloaded(*args):
     pass
 
 
+def _nodeRenamed(mobj, oldName, *args):
+    pass
+
+
+def _nodeDeleted(mobj, *args):
+    pass
+
+
+def _dagParentChanged(child, parent, *args):
+    pass
+
+
+def _attrChanged(msg, plug, *args):
+    pass
+
+
+def _unitChanged(*args):
+    pass
+
+
 def _installCallbacks():
     """
     install the callbacks that trigger new nodes and commands to be added to pymel when a
-    plugin loads.  This is called from pymel.__init__
+    plugin loads, the node rename / delete, dag parent change and attribute add /
+    remove callbacks that keep the PyNode construction cache and attribute name
+    indexes valid, and the unit change callbacks that clear the cached unit
+    conversions of the datatypes.Unit classes.  This is called from pymel.__init__
     """
 
     pass
@@ -65,6 +88,8 @@ _pluginLoadedCB = True
 
 _pluginData = {}
 
+_nodeCacheCallbacks = []
+
 _logger = None
 
 
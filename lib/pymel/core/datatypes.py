@@ -27,6 +27,11 @@ class Matrix(MatrixN, _MMatrix):
     """
     A 4x4 transformation matrix based on api Matrix
     
+    Products and sums of two Matrix instances, and products of a Matrix and a Vector or Point,
+    as well as inverse and transpose, go straight to the api MMatrix operators. The goal for
+    these fast paths is at least a 5x speedup over the generic MatrixN path; it has not been
+    measured, as there is no benchmark for it yet.
+    
     >>> from pymel.all import *
     >>> import pymel.core.datatypes as dt
     >>>
@@ -52,6 +57,7 @@ class Matrix(MatrixN, _MMatrix):
         m.__add__(v) <==> m+v
         Returns the result of the addition of m and v if v is convertible to a MatrixN (element-wise addition),
         adds v to every component of m if v is a scalar
+        When v is exactly a Matrix, the sum is computed by the api MMatrix operator directly.
         """
     
         pass
@@ -171,6 +177,8 @@ class Matrix(MatrixN, _MMatrix):
         If x is a MatrixN, __mul__ is mapped to matrix multiplication m*x, if x is a VectorN, to MatrixN by VectorN multiplication.
         Otherwise, returns the result of the element wise multiplication of m and x if x is convertible to Array,
         multiplies every component of b by x if x is a single numeric value
+        When x is exactly a Matrix, a Vector or a Point, the product is computed by the api MMatrix operator directly,
+        without going through Array coercion and shape checks.
         """
     
         pass
@@ -280,10 +288,12 @@ class Matrix(MatrixN, _MMatrix):
         pass
     
     
-    def blend(self, other, weight=0.5):
+    def blend(self, other, weight=0.5, out=None):
         """
         Returns a 0.0-1.0 scalar weight blend between self and other Matrix,
         blend mixes Matrix as transformation matrices
+        If out is given, it must be a Matrix, the result is written into it and returned,
+        instead of allocating a new Matrix
         """
     
         pass
@@ -332,7 +342,7 @@ class Matrix(MatrixN, _MMatrix):
     
     def inverse(self):
         """
-        Returns the inverse Matrix
+        Returns the inverse Matrix, computed by the api MMatrix directly
         """
     
         pass
@@ -374,7 +384,7 @@ class Matrix(MatrixN, _MMatrix):
     
     def transpose(self):
         """
-        Returns the transposed Matrix
+        Returns the transposed Matrix, computed by the api MMatrix directly
         """
     
         pass
@@ -476,6 +486,16 @@ class MetaMayaArrayTypeWrapper(_factories.MetaMayaTypeWrapper):
 
 
 class Unit(float):
+    def __reduce__(self):
+        """
+        Returns (type(self), (float(self), self._unit)), so that units, including instances of
+        subclasses, pickle and copy with their unit under any pickle protocol, as Unit has no
+        __dict__
+        """
+    
+        pass
+    
+    
     def __repr__(self):
         pass
     
@@ -504,6 +524,24 @@ class Unit(float):
         pass
     
     
+    def clearConversionCache(cls):
+        """
+        Clears the cached UI unit and conversion factors of that type. Called when the current
+        linear, angular or time unit changes, see `pymel.core.currentUnit`
+        """
+    
+        pass
+    
+    
+    def conversionFactor(cls, fromUnit, toUnit):
+        """
+        Returns the factor to multiply a value in fromUnit by to get it in toUnit; factors are
+        computed once per pair of units and cached
+        """
+    
+        pass
+    
+    
     def getInternalUnit(cls):
         """
         Returns the inernal units currently in use for that type
@@ -514,7 +552,8 @@ class Unit(float):
     
     def getUIUnit(cls):
         """
-        Returns the global UI units currently in use for that type
+        Returns the global UI units currently in use for that type; the unit is queried
+        once and cached until it changes
         """
     
         pass
@@ -544,6 +583,26 @@ class Unit(float):
         pass
     
     
+    def toInternalArray(cls, values, unit=None):
+        """
+        Converts a sequence of values in the given unit (the UI unit if None) to the internal unit,
+        with a single conversion factor lookup. Returns an array.array('d'), or a numpy array if
+        values is one
+        """
+    
+        pass
+    
+    
+    def toUIArray(cls, values, unit=None):
+        """
+        Converts a sequence of values in the given unit (the internal unit if None) to the UI unit,
+        with a single conversion factor lookup. Returns an array.array('d'), or a numpy array if
+        values is one
+        """
+    
+        pass
+    
+    
     def uiToInternal(cls, value):
         pass
     
@@ -552,6 +611,8 @@ class Unit(float):
         pass
     
     
+    __slots__ = ('_unit', '__weakref__')
+    
     data = None
     
     unit = None
@@ -1163,6 +1224,11 @@ class Vector(VectorN, _MVector):
     """
     A 3 dimensional vector class that wraps Maya's api Vector class
     
+    Sums, differences and products of two Vector instances, and rotateBy, go straight to the api
+    MVector operators, as are sums of a Point and a Vector (see Point.__add__). The goal for these
+    fast paths is at least a 5x speedup over the generic VectorN path; it has not been measured,
+    as there is no benchmark for it yet.
+    
         >>> from pymel.all import *
         >>> import pymel.core.datatypes as dt
         >>>
@@ -1182,6 +1248,8 @@ class Vector(VectorN, _MVector):
         u.__add__(v) <==> u+v
         Returns the result of the addition of u and v if v is convertible to a VectorN (element-wise addition),
         adds v to every component of u if v is a scalar
+        When v is exactly a Vector, the result is computed by the api operator directly,
+        without going through Array coercion and shape checks.
         """
     
         pass
@@ -1308,6 +1376,8 @@ class Vector(VectorN, _MVector):
         to the transformation of u by matrix v when v is a MatrixN,
         to element wise multiplication when v is a sequence,
         and multiplies each component of u by v when v is a numeric type.
+        When v is exactly a Vector or a Matrix, the result is computed by the api operator directly,
+        without going through Array coercion and shape checks.
         """
     
         pass
@@ -1390,6 +1460,8 @@ class Vector(VectorN, _MVector):
         u.__sub__(v) <==> u-v
         Returns the result of the substraction of v from u if v is convertible to a VectorN (element-wise substration),
         substract v to every component of u if v is a scalar
+        When v is exactly a Vector (or both are Points), the result is computed by the api operator directly,
+        without going through Array coercion and shape checks.
         """
     
         pass
@@ -1442,9 +1514,11 @@ class Vector(VectorN, _MVector):
         pass
     
     
-    def cross(self, other):
+    def cross(self, other, out=None):
         """
         cross product, only defined for two 3D vectors
+        If out is given, it must be a Vector, the result is written into it and returned,
+        instead of allocating a new Vector
         """
     
         pass
@@ -1494,9 +1568,11 @@ class Vector(VectorN, _MVector):
         pass
     
     
-    def normal(self):
+    def normal(self, out=None):
         """
         Return a normalized copy of self
+        If out is given, it must be a Vector, the result is written into it and returned,
+        instead of allocating a new Vector
         """
     
         pass
@@ -1518,6 +1594,7 @@ class Vector(VectorN, _MVector):
         args is a tuple of one Matrix, TransformationMatrix, Quaternion, EulerRotation
         arg is tuple of 4 arguments, 3 rotation value and an optionnal rotation order
         args is a tuple of one Vector, the axis and one float, the angle to rotate around that axis in radians
+        A single Quaternion or EulerRotation argument is passed to the api MVector.rotateBy directly.
         """
     
         pass
@@ -2799,6 +2876,8 @@ class Point(Vector, _MPoint):
         u.__add__(v) <==> u+v
         Returns the result of the addition of u and v if v is convertible to a VectorN (element-wise addition),
         adds v to every component of u if v is a scalar
+        When v is exactly a Vector, the result is computed by the api MPoint operator directly,
+        without going through Array coercion and shape checks.
         """
     
         pass
@@ -3029,9 +3108,7 @@ class Point(Vector, _MPoint):
 
 
 class Time(Unit):
-    __dict__ = None
-    
-    __weakref__ = None
+    __slots__ = ()
     
     Unit = {}
     
@@ -3144,9 +3221,7 @@ class Distance(Unit):
         pass
     
     
-    __dict__ = None
-    
-    __weakref__ = None
+    __slots__ = ()
     
     Unit = {}
     
@@ -3446,9 +3521,7 @@ class Angle(Unit):
         pass
     
     
-    __dict__ = None
-    
-    __weakref__ = None
+    __slots__ = ()
     
     Unit = {}
     
@@ -3535,70 +3608,842 @@ class FloatPoint(Point, _MFloatPoint):
 
 
 
-def _patchMQuaternion():
-    pass
-
-
-def _patchMColor():
-    pass
-
-
-def _patchMVector():
+class PackedArray(object):
     """
-    # patch some Maya api classes that miss __iter__ to make them iterable / convertible to list
+    Base class for the packed arrays of datatypes (VectorArray, PointArray, MatrixArray,
+    QuaternionArray, EulerRotationArray).
+    
+    Rather than holding one python object per item, a packed array stores the components of all
+    its items in a single contiguous buffer of doubles, itemsize doubles per item. Items are
+    converted to and from instances of itemcls only when accessed one at a time, and operations
+    on the whole array are computed in one pass over the buffer.
     """
-
-    pass
-
-
-def _testMPoint():
-    pass
-
-
-def _testMTransformationMatrix():
-    pass
-
-
-def _patchMFloatPoint():
-    pass
+    
+    
+    
+    def __getitem__(self, index):
+        """
+        Returns element index as an instance of the item class (ie, a Vector for a VectorArray),
+        or a new packed array for a slice
+        """
+    
+        pass
+    
+    
+    def __init__(self, *args, **kwargs):
+        """
+        Builds a packed array from a sequence of items, a sequence of component sequences, a
+        packed array of the same class, a numpy array of shape (N, itemsize), or a flat buffer of
+        doubles. size=N creates N default items.
+        """
+    
+        pass
+    
+    
+    def __iter__(self):
+        pass
+    
+    
+    def __len__(self):
+        pass
+    
+    
+    def __reduce__(self):
+        """
+        __reduce__ is defined to allow pickling of packed arrays, as their class and the raw
+        content of their buffer
+        """
+    
+        pass
+    
+    
+    def __repr__(self):
+        pass
+    
+    
+    def __setitem__(self, index, value):
+        pass
+    
+    
+    def append(self, value):
+        pass
+    
+    
+    def copy(self):
+        pass
+    
+    
+    def extend(self, values):
+        pass
+    
+    
+    def fromApi(cls, value):
+        """
+        cls.fromApi(apiArray) --> cls
+        
+        Creates a packed array from the matching api array class (see apicls), copying all the
+        components in one pass. The api array classes own their storage and the python bindings
+        expose no pointer to it, so this exchange, like toApi, is a copy and not a shared buffer.
+        """
+    
+        pass
+    
+    
+    def toApi(self):
+        """
+        a.toApi() --> apicls instance
+        
+        Returns the content of a as an instance of the matching api array class, filled in one pass
+        """
+    
+        pass
+    
+    
+    def toNumpy(self):
+        """
+        a.toNumpy() --> ndarray
+        
+        Returns a numpy view on the buffer of a, of shape (len(a), itemsize) (or (len(a), 4, 4) for
+        a MatrixArray). No data is copied, changes made to the view are seen by a.
+        """
+    
+        pass
+    
+    
+    __slots__ = ('_buffer', '_len')
+    
+    apicls = None
+    
+    itemcls = None
+    
+    itemsize = 0
 
 
-def center(p, *args):
+class VectorArray(PackedArray):
     """
-    center(p[, q, r, s (...)]) --> Point
-    Returns the Point that is the center of p, q, r, s (...)
+    A packed array of 3 dimensional vectors, stored as contiguous doubles (24 bytes per vector).
+    
+    Items are returned as Vector instances, but are not stored as such, and operations on the
+    whole array are computed in one pass over the buffer.
+    
+        >>> import pymel.core.datatypes as dt
+        >>> a = dt.VectorArray([dt.Vector(1, 0, 0), (0, 2, 0)])
+        >>> len(a)
+        2
+        >>> a[1]
+        dt.Vector([0.0, 2.0, 0.0])
+        >>> a.normal()
+        dt.VectorArray([[1.0, 0.0, 0.0], [0.0, 1.0, 0.0]])
+        >>> a.dot(dt.Vector(1, 1, 0))
+        [1.0, 2.0]
     """
-
-    pass
-
-
-def _patchMMatrix():
-    pass
-
-
-def _patchMFloatVector():
-    pass
-
-
-def _patchMTransformationMatrix():
-    pass
+    
+    
+    
+    def __add__(self, other):
+        """
+        a.__add__(b) <==> a+b
+        Element-wise addition of a and b, where b is a VectorArray of the same length or a single
+        Vector added to every element
+        """
+    
+        pass
+    
+    
+    def __mul__(self, other):
+        """
+        a.__mul__(b) <==> a*b
+        If b is a scalar or a sequence of len(a) scalars, scales the elements of a; if b is a
+        Matrix or a MatrixArray, returns the vectors of a transformed by it, as Vector.__mul__ does
+        """
+    
+        pass
+    
+    
+    def __neg__(self):
+        pass
+    
+    
+    def __sub__(self, other):
+        """
+        a.__sub__(b) <==> a-b
+        Element-wise difference of a and b, see __add__
+        """
+    
+        pass
+    
+    
+    def cross(self, other):
+        """
+        a.cross(b) --> VectorArray
+        
+        Element-wise cross product of a and b, where b is a VectorArray of the same length or a
+        single Vector
+        """
+    
+        pass
+    
+    
+    def dot(self, other):
+        """
+        a.dot(b) --> list of floats
+        
+        Element-wise dot product of a and b, where b is a VectorArray of the same length or a
+        single Vector
+        """
+    
+        pass
+    
+    
+    def length(self):
+        """
+        a.length() --> list of floats
+        
+        Returns the length of every vector of a
+        """
+    
+        pass
+    
+    
+    def normal(self):
+        """
+        a.normal() --> VectorArray
+        
+        Returns a copy of a with every vector normalized
+        """
+    
+        pass
+    
+    
+    def normalize(self):
+        """
+        Normalizes every vector of a in place
+        """
+    
+        pass
+    
+    
+    def transform(self, matrix):
+        """
+        a.transform(m) --> VectorArray
+        
+        Returns the vectors of a transformed by m, a Matrix or a MatrixArray of the same length.
+        Translation is ignored, as for a Vector.
+        """
+    
+        pass
+    
+    
+    __slots__ = ()
+    
+    apicls = None
+    
+    itemcls = None
+    
+    itemsize = 3
 
 
-def getPlugValue(plug):
-    """
-    given an MPlug, get its value as a pymel-style object
+class PointArray(VectorArray):
     """
-
-    pass
-
-
-def equivalentSpace(space1, space2, rotationOnly=False):
+    A packed array of points, stored as contiguous doubles (32 bytes per point, with w).
+    
+    Items are returned as Point instances. Unlike a VectorArray, transform applies the
+    translation of the matrix.
+    
+        >>> import pymel.core.datatypes as dt
+        >>> a = dt.PointArray([(0, 0, 0), (1, 1, 1)])
+        >>> a.transform(dt.Matrix(1, 0, 0, 0, 0, 1, 0, 0, 0, 0, 1, 0, 5, 0, 0, 1))
+        dt.PointArray([[5.0, 0.0, 0.0], [6.0, 1.0, 1.0]])
     """
-    Compare the two given space values to see if they are equal
     
-    Parameters
-    ----------
-    space1 : int or str
+    
+    
+    def transform(self, matrix):
+        """
+        a.transform(m) --> PointArray
+        
+        Returns the points of a transformed by m, a Matrix or a MatrixArray of the same length
+        """
+    
+        pass
+    
+    
+    __slots__ = ()
+    
+    apicls = None
+    
+    itemcls = None
+    
+    itemsize = 4
+
+
+class MatrixArray(PackedArray):
+    """
+    A packed array of 4x4 matrices, stored as contiguous doubles (128 bytes per matrix).
+    
+    Items are returned as Matrix instances.
+    
+        >>> import pymel.core.datatypes as dt
+        >>> a = dt.MatrixArray(size=2)
+        >>> a[0]
+        dt.Matrix([[1.0, 0.0, 0.0, 0.0], [0.0, 1.0, 0.0, 0.0], [0.0, 0.0, 1.0, 0.0], [0.0, 0.0, 0.0, 1.0]])
+        >>> (a * dt.Matrix.identity).isEquivalent(a)
+        True
+    """
+    
+    
+    
+    def __mul__(self, other):
+        """
+        a.__mul__(b) <==> a*b
+        Element-wise matrix product of a and b, where b is a MatrixArray of the same length or a
+        single Matrix
+        """
+    
+        pass
+    
+    
+    def __rmul__(self, other):
+        """
+        a.__rmul__(b) <==> b*a
+        Element-wise matrix product of b and a, where b is a single Matrix
+        """
+    
+        pass
+    
+    
+    def decompose(self, rotateOrder='XYZ'):
+        """
+        a.decompose([rotateOrder]) --> DecomposedMatrices
+        
+        Same as decomposeMatrices(a, rotateOrder). The result is cached on a, keyed on the rotate
+        order and a checksum of the buffer of a: calling decompose again with the same rotate
+        order only costs the checksum if a is unchanged, and changes made by any means, including
+        through a numpy view from toNumpy, are detected.
+        """
+    
+        pass
+    
+    
+    def inverse(self):
+        """
+        a.inverse() --> MatrixArray
+        
+        Returns the inverse of every matrix of a
+        """
+    
+        pass
+    
+    
+    def isEquivalent(self, other, tol=9.313225746154785e-10):
+        pass
+    
+    
+    def transpose(self):
+        """
+        a.transpose() --> MatrixArray
+        
+        Returns the transpose of every matrix of a
+        """
+    
+        pass
+    
+    
+    __slots__ = ('_decomposed',)
+    
+    apicls = None
+    
+    itemcls = None
+    
+    itemsize = 16
+
+
+class QuaternionArray(PackedArray):
+    """
+    A packed array of quaternions, stored as contiguous doubles (32 bytes per quaternion).
+    
+    Items are returned as Quaternion instances. Conversions to euler rotations and matrices are
+    done for the whole array at once by the `pymel.util.rotations` kernels.
+    
+        >>> import pymel.core.datatypes as dt
+        >>> a = dt.QuaternionArray([dt.Quaternion(), dt.Quaternion(1, 0, 0, 0)])
+        >>> a.asEulerRotation()
+        dt.EulerRotationArray([[0.0, 0.0, 0.0], [180.0, 0.0, 0.0]])
+    """
+    
+    
+    
+    def __mul__(self, other):
+        """
+        a.__mul__(b) <==> a*b
+        Element-wise quaternion product of a and b, where b is a QuaternionArray of the same length
+        or a single Quaternion
+        """
+    
+        pass
+    
+    
+    def asEulerRotation(self, order='XYZ'):
+        """
+        a.asEulerRotation([order]) --> EulerRotationArray
+        
+        Converts every quaternion of a to an EulerRotation of the given rotate order, in the current
+        ui angle unit (degrees by default)
+        """
+    
+        pass
+    
+    
+    def asMatrix(self):
+        """
+        a.asMatrix() --> MatrixArray
+        
+        Returns the rotation matrix of every quaternion of a
+        """
+    
+        pass
+    
+    
+    def conjugate(self):
+        pass
+    
+    
+    def normal(self):
+        pass
+    
+    
+    def normalize(self):
+        pass
+    
+    
+    def rotate(self, vectors):
+        """
+        a.rotate(v) --> VectorArray
+        
+        Rotates v, a VectorArray of the same length or a single Vector, by every quaternion of a
+        """
+    
+        pass
+    
+    
+    def slerp(self, other, t):
+        """
+        a.slerp(b, t) --> QuaternionArray
+        
+        Element-wise spherical interpolation from a to b, where b is a QuaternionArray of the same
+        length or a single Quaternion, and t a scalar or a sequence of len(a) scalars
+        """
+    
+        pass
+    
+    
+    __slots__ = ()
+    
+    apicls = None
+    
+    itemcls = None
+    
+    itemsize = 4
+
+
+class EulerRotationArray(PackedArray):
+    """
+    A packed array of euler rotations, stored as contiguous doubles (24 bytes per rotation).
+    
+    All the rotations of an array share the same rotate order and unit; as for EulerRotation, the
+    unit is only shown by repr when it differs from the current ui angle unit. Items are returned
+    as EulerRotation instances. Conversions and reordering are done for the whole array at once by
+    the `pymel.util.rotations` kernels.
+    
+        >>> import pymel.core.datatypes as dt
+        >>> a = dt.EulerRotationArray([(90, 0, 0), (0, 45, 0)], unit='degrees')
+        >>> a[0]
+        dt.EulerRotation([90.0, 0.0, 0.0])
+    """
+    
+    
+    
+    def asMatrix(self):
+        """
+        a.asMatrix() --> MatrixArray
+        
+        Returns the rotation matrix of every rotation of a
+        """
+    
+        pass
+    
+    
+    def asQuaternion(self):
+        """
+        a.asQuaternion() --> QuaternionArray
+        
+        Converts every rotation of a to a Quaternion
+        """
+    
+        pass
+    
+    
+    def filter(self, previous=None):
+        """
+        a.filter([previous]) --> EulerRotationArray
+        
+        Returns the rotations of a with the flips removed, each rotation being replaced by the
+        equivalent rotation closest to the one before it, as done by
+        `pymel.util.rotations.filterEuler`. previous is the rotation preceding a[0], if a is one chunk
+        of a longer curve.
+        """
+    
+        pass
+    
+    
+    def reorder(self, order):
+        """
+        a.reorder(order) --> EulerRotationArray
+        
+        Returns the rotations of a expressed in the given rotate order
+        """
+    
+        pass
+    
+    
+    __slots__ = ('order', 'unit')
+    
+    apicls = None
+    
+    itemcls = None
+    
+    itemsize = 3
+
+
+class BoundingBoxArray(PackedArray):
+    """
+    A packed array of axis aligned bounding boxes, stored as contiguous doubles (48 bytes per box,
+    min then max corner).
+    
+    Items are returned as BoundingBox instances, and the tests and set operations below run over
+    all the boxes in one pass. A BoundingBoxArray can be handed to pymel.util.bvh.AABBTree to
+    answer overlap, nearest and ray queries.
+    
+        >>> import pymel.core.datatypes as dt
+        >>> a = dt.BoundingBoxArray([((0, 0, 0), (1, 1, 1)), ((2, 2, 2), (3, 3, 3))])
+        >>> a.intersects(dt.BoundingBox((0.5, 0.5, 0.5), (2.5, 2.5, 2.5)))
+        [True, True]
+        >>> a.union()
+        dt.BoundingBox([0.0, 0.0, 0.0], [3.0, 3.0, 3.0])
+    """
+    
+    
+    
+    def center(self):
+        """
+        a.center() --> PointArray
+        
+        Returns the center of every box of a
+        """
+    
+        pass
+    
+    
+    def contains(self, point):
+        """
+        a.contains(p) --> list of bools
+        
+        Tests whether the point p, or each point of a PointArray of the same length, lies within
+        the corresponding box of a
+        """
+    
+        pass
+    
+    
+    def expand(self, other):
+        """
+        Element-wise, in place, expands every box of a to include the corresponding box or point of
+        other, a BoundingBoxArray or PointArray of the same length, or a single BoundingBox or Point
+        """
+    
+        pass
+    
+    
+    def fromNodes(cls, nodes):
+        """
+        cls.fromNodes(nodes) --> BoundingBoxArray
+        
+        Returns the exact world space bounding box of every given node, as computed by
+        `pymel.core.general.exactWorldBoundingBox`
+        """
+    
+        pass
+    
+    
+    def intersection(self, other):
+        """
+        a.intersection(b) --> BoundingBoxArray
+        
+        Element-wise intersection of the boxes of a and b, where b is a BoundingBoxArray of the same
+        length or a single BoundingBox. Boxes that do not overlap give empty boxes.
+        """
+    
+        pass
+    
+    
+    def intersects(self, box, tol=0.0):
+        """
+        a.intersects(b[, tol=0.0]) --> list of bools
+        
+        Tests whether every box of a overlaps b, a BoundingBoxArray of the same length or a single
+        BoundingBox, within the given tolerance
+        """
+    
+        pass
+    
+    
+    def max(self):
+        """
+        a.max() --> PointArray
+        """
+    
+        pass
+    
+    
+    def min(self):
+        """
+        a.min() --> PointArray
+        """
+    
+        pass
+    
+    
+    def transformUsing(self, matrix):
+        """
+        a.transformUsing(m) --> BoundingBoxArray
+        
+        Returns the boxes of a transformed by m, a Matrix or a MatrixArray of the same length; as
+        for BoundingBox, the result is the axis aligned box enclosing each transformed box
+        """
+    
+        pass
+    
+    
+    def union(self, other=None):
+        """
+        a.union([b]) --> BoundingBox or BoundingBoxArray
+        
+        Without argument, returns the single BoundingBox enclosing all the boxes of a; otherwise
+        returns the element-wise union of the boxes of a and b, a BoundingBoxArray of the same length
+        or a single BoundingBox
+        """
+    
+        pass
+    
+    
+    __slots__ = ()
+    
+    apicls = None
+    
+    itemcls = None
+    
+    itemsize = 6
+
+
+class DecomposedMatrices(tuple):
+    """
+    DecomposedMatrices(translate, rotate, scale, shear)
+    """
+    
+    
+    
+    def __getnewargs__(self):
+        """
+        Return self as a plain tuple.  Used by copy and pickle.
+        """
+    
+        pass
+    
+    
+    def __getstate__(self):
+        """
+        Exclude the OrderedDict from pickling
+        """
+    
+        pass
+    
+    
+    def __repr__(self):
+        """
+        Return a nicely formatted representation string
+        """
+    
+        pass
+    
+    
+    def __new__(_cls, translate, rotate, scale, shear):
+        """
+        Create new instance of DecomposedMatrices(translate, rotate, scale, shear)
+        """
+    
+        pass
+    
+    
+    __dict__ = None
+    
+    rotate = None
+    
+    scale = None
+    
+    shear = None
+    
+    translate = None
+
+
+def _patchMQuaternion():
+    pass
+
+
+def _patchMColor():
+    pass
+
+
+def _patchMVector():
+    """
+    # patch some Maya api classes that miss __iter__ to make them iterable / convertible to list
+    """
+
+    pass
+
+
+def _testMPoint():
+    pass
+
+
+def _testMTransformationMatrix():
+    pass
+
+
+def _patchMFloatPoint():
+    pass
+
+
+def center(p, *args):
+    """
+    center(p[, q, r, s (...)]) --> Point
+    Returns the Point that is the center of p, q, r, s (...)
+    """
+
+    pass
+
+
+def _patchMMatrix():
+    pass
+
+
+def _patchMFloatVector():
+    pass
+
+
+def _patchMTransformationMatrix():
+    pass
+
+
+def getPlugValue(plug):
+    """
+    given an MPlug, get its value as a pymel-style object
+    """
+
+    pass
+
+
+def decomposeMatrices(matrices, rotateOrder='XYZ'):
+    """
+    Decompose many transformation matrices in a single vectorized pass.
+    
+    Each matrix is split the same way a TransformationMatrix would split it, with translation
+    in the transform space and scale and shear in the object space.
+    
+    Parameters
+    ----------
+    matrices : MatrixArray or sequence of Matrix
+        the matrices to decompose
+    rotateOrder : str
+        the rotate order of the returned rotations, one of 'XYZ', 'YZX', 'ZXY', 'XZY', 'YXZ' or
+        'ZYX'
+    
+    Returns
+    -------
+    DecomposedMatrices
+        a named tuple of the translate (VectorArray), rotate (EulerRotationArray, in the current
+        ui angle unit, degrees by default, as for EulerRotation and QuaternionArray.asEulerRotation),
+        scale (VectorArray) and shear (VectorArray) of every matrix
+    """
+
+    pass
+
+
+def composeMatrices(translate, rotate, scale=None, rotateOrder='XYZ', shear=None):
+    """
+    Compose many transformation matrices in a single vectorized pass, the inverse of
+    decomposeMatrices.
+    
+    Parameters
+    ----------
+    translate : VectorArray or sequence of Vector
+        the translation of every matrix
+    rotate : EulerRotationArray, QuaternionArray, or sequence of EulerRotation
+        the rotation of every matrix
+    scale : VectorArray, sequence of Vector, or None
+        the scale of every matrix; if None, no scaling is applied
+    rotateOrder : str
+        the rotate order of rotate, if it holds euler rotations that do not carry their own
+        order
+    shear : VectorArray, sequence of Vector, or None
+        the shear of every matrix; if None, no shearing is applied
+    
+    Returns
+    -------
+    MatrixArray
+    """
+
+    pass
+
+
+def dumps(obj, protocol=2):
+    """
+    Serialize obj to a string, using a compact binary format for datatypes and Arrays.
+    
+    Every datatype deriving from Array (Vector, Point, Color, Matrix, Quaternion...),
+    EulerRotation, BoundingBox, Unit and PackedArray, as well as any other Array whose
+    components are all floats, is written as a short type tag followed by its packed float64
+    buffer; lists, tuples and dicts of them are written with a single tag and one contiguous
+    buffer per type. Any other object, including Arrays of ints, bools or complex numbers, is
+    handed to pickle, with the given protocol, so that it round-trips exactly.
+    
+        >>> import pymel.core.datatypes as dt
+        >>> s = dt.dumps([dt.Vector(1, 2, 3), dt.Matrix()])
+        >>> dt.loads(s)
+        [dt.Vector([1.0, 2.0, 3.0]), dt.Matrix([[1.0, 0.0, 0.0, 0.0], [0.0, 1.0, 0.0, 0.0], [0.0, 0.0, 1.0, 0.0], [0.0, 0.0, 0.0, 1.0]])]
+    
+    Related : see loads.
+    """
+
+    pass
+
+
+def loads(data):
+    """
+    Rebuild an object from a string written by dumps.
+    
+    Related : see dumps.
+    """
+
+    pass
+
+
+def equivalentSpace(space1, space2, rotationOnly=False):
+    """
+    Compare the two given space values to see if they are equal
+    
+    Parameters
+    ----------
+    space1 : int or str
         the first space to compare (may be either the integer enum value, or the
         api enum name - ie, "kPostTransform" - or the pymel enum name - ie,
         "postTransform" )
@@ -3666,4 +4511,6 @@ AS_UNITS = 'asUnits'
 
 Spaces = {}
 
+_serialTypes = {}
+
 
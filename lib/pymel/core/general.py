@@ -55,6 +55,165 @@ class ComponentIndex(tuple):
     __dict__ = None
 
 
+class ComponentIndexSet(object):
+    """
+    A compact, immutable set of non-negative integer component indices.
+    
+    The indices are stored as sorted, non-overlapping ``[start, stop)`` runs in an
+    ``array('i')``, so a contiguous selection of millions of vertices takes just a
+    few bytes.  Membership tests, ``len()``, iteration, indexing and slicing all
+    work directly on the runs, without creating a python object per element.
+    
+        >>> s = ComponentIndexSet([0, 1, 2, 3, 10, 11, 20])
+        >>> s
+        ComponentIndexSet([0:4, 10:12, 20])
+        >>> len(s)
+        7
+        >>> 11 in s, 12 in s
+        (True, False)
+        >>> s[4]
+        10
+        >>> s[-2:]
+        ComponentIndexSet([11, 20])
+        >>> s | ComponentIndexSet.fromRanges([(4, 10)])
+        ComponentIndexSet([0:12, 20])
+        >>> s - ComponentIndexSet([1, 2, 11])
+        ComponentIndexSet([0, 3, 10, 20])
+    """
+    
+    
+    
+    def __and__(self, other):
+        pass
+    
+    
+    def __contains__(self, index):
+        pass
+    
+    
+    def __eq__(self, other):
+        pass
+    
+    
+    def __getitem__(self, item):
+        """
+        Returns the index at the given flat position, or a new `ComponentIndexSet`
+        for a slice
+        """
+    
+        pass
+    
+    
+    def __hash__(self):
+        pass
+    
+    
+    def __init__(self, indices=()):
+        """
+        :Parameters:
+        indices : iterable of `int`
+            the indices to store; need not be sorted or unique
+        """
+    
+        pass
+    
+    
+    def __iter__(self):
+        pass
+    
+    
+    def __len__(self):
+        pass
+    
+    
+    def __ne__(self, other):
+        pass
+    
+    
+    def __nonzero__(self):
+        pass
+    
+    
+    def __or__(self, other):
+        pass
+    
+    
+    def __reduce__(self):
+        pass
+    
+    
+    def __repr__(self):
+        pass
+    
+    
+    def __sub__(self, other):
+        pass
+    
+    
+    def __xor__(self, other):
+        pass
+    
+    
+    def fromElements(cls, elements):
+        """
+        Build a set from an `MIntArray`, such as the one filled by
+        ``MFnSingleIndexedComponent.getElements``, in a single pass
+        
+        :rtype: `ComponentIndexSet`
+        """
+    
+        pass
+    
+    
+    def fromRanges(cls, ranges):
+        """
+        Build a set from an iterable of (start, stop) pairs, where stop is exclusive
+        
+        :rtype: `ComponentIndexSet`
+        """
+    
+        pass
+    
+    
+    def isdisjoint(self, other):
+        pass
+    
+    
+    def issubset(self, other):
+        pass
+    
+    
+    def issuperset(self, other):
+        pass
+    
+    
+    def max(self):
+        pass
+    
+    
+    def min(self):
+        pass
+    
+    
+    def ranges(self):
+        """
+        An iterator over the (start, stop) runs of this set, where stop is exclusive
+        """
+    
+        pass
+    
+    
+    def toMIntArray(self):
+        """
+        :rtype: `MIntArray`
+        """
+    
+        pass
+    
+    
+    __slots__ = ('_runs', '_len')
+
+
 class MayaObjectError(exceptions.TypeError):
     """
     #--------------------------
@@ -184,6 +343,12 @@ class PyNode(_util.ProxyUnicode):
     def __apimfn__(self):
         """
         Get a ``maya.OpenMaya*.MFn*`` instance
+        
+        The function set is built on first use and cached on the instance, so
+        repeated api method calls on the same PyNode share it.  It is rebuilt if
+        the node's `MObjectHandle` is no longer valid, or, for dag nodes, if the
+        node's `MDagPath` has changed since it was built.  Components do not use
+        this per-instance cache, see `Component.__apimfn__`.
         """
     
         pass
@@ -397,6 +562,19 @@ class PyNode(_util.ProxyUnicode):
         pass
     
     
+    def getAttrs(self, names, **kwargs):
+        """
+        Returns the values of the named attributes on this node, in order.
+        
+        Equivalent to ``getAttrs([self.attr(x) for x in names], **kwargs)``, but each
+        name is resolved against this node's `MObject` only once.
+        
+        :rtype: `list`
+        """
+    
+        pass
+    
+    
     def history(*args, **kwargs):
         """
         This command traverses backwards or forwards in the graph from the specified node and returns all of the nodes whose
@@ -904,51 +1082,340 @@ class NodeTracker(object):
     
     
     
-    def __enter__(self):
+    def __enter__(self):
+        pass
+    
+    
+    def __exit__(self, exctype, excval, exctb):
+        pass
+    
+    
+    def __init__(self):
+        pass
+    
+    
+    def endTrack(self):
+        """
+        Stop tracking and remove the callback
+        """
+    
+        pass
+    
+    
+    def getNodes(self, returnType='PyNode'):
+        """
+        Return a list of maya objects as strings.
+        
+        Parameters
+        ----------
+        returnType : {'PyNode', 'str', 'MObject'}
+        """
+    
+        pass
+    
+    
+    def isTracking(self):
+        """
+        Return True/False
+        """
+    
+        pass
+    
+    
+    def reset(self):
+        pass
+    
+    
+    def startTrack(self):
+        pass
+    
+    
+    __dict__ = None
+    
+    __weakref__ = None
+
+
+class ConnectionSnapshot(object):
+    """
+    A frozen, indexed copy of the connections in the current scene, for answering
+    many graph queries without going back to Maya.
+    
+    All plug connections are captured once, by walking `MItDependencyNodes` and
+    ``MPlug.connectedTo``, into per-node adjacency arrays.  Upstream / downstream
+    traversal, path and cycle queries then run entirely in python.
+    
+        >>> import pymel.core as pm
+        >>> sphere = pm.polySphere()[0]
+        >>> snap = ConnectionSnapshot()
+        >>> snap.upstream(sphere.getShape(), depth=1)
+        [nt.PolySphere(u'polySphere1')]
+        >>> snap.path(u'polySphere1', sphere.getShape())
+        [nt.PolySphere(u'polySphere1'), nt.Mesh(u'pSphereShape1')]
+    
+    Like `NodeTracker`, it can be used as a context manager, in which case it keeps
+    itself up to date with node creation, deletion and connection changes made
+    inside the block, instead of re-capturing the whole scene.
+    """
+    
+    
+    
+    def __contains__(self, node):
+        pass
+    
+    
+    def __enter__(self):
+        pass
+    
+    
+    def __exit__(self, exctype, excval, exctb):
+        pass
+    
+    
+    def __init__(self, nodes=None):
+        """
+        :Parameters:
+        nodes : iterable of `PyNode`, or None
+            restrict the snapshot to the connections between these nodes; if None,
+            every dependency node in the scene is captured
+        """
+    
+        pass
+    
+    
+    def __len__(self):
+        pass
+    
+    
+    def connections(self, node, source=True, destination=True, plugs=False):
+        """
+        Returns the nodes (or, if plugs is True, the (local plug, remote plug) pairs)
+        directly connected to the given node or attribute
+        
+        :rtype: `PyNode` list
+        """
+    
+        pass
+    
+    
+    def cycles(self, node=None):
+        """
+        Returns the cycles in the snapshot, as lists of nodes.  If a node is given, only
+        the cycles passing through it are returned.
+        
+        :rtype: `list` of `PyNode` list
+        """
+    
+        pass
+    
+    
+    def downstream(self, node, depth=None):
+        """
+        Returns the nodes fed by the given node or attribute, breadth first.
+        
+        :Parameters:
+        depth : `int` or None
+            the maximum number of connections to follow; if None, there is no limit
+        
+        :rtype: `PyNode` list
+        """
+    
+        pass
+    
+    
+    def endTrack(self):
+        """
+        Stop keeping the snapshot up to date, and remove the callbacks
+        """
+    
+        pass
+    
+    
+    def hasCycle(self, node=None):
+        """
+        :rtype: `bool`
+        """
+    
+        pass
+    
+    
+    def isTracking(self):
+        """
+        Return True/False
+        """
+    
+        pass
+    
+    
+    def path(self, source, destination):
+        """
+        Returns the shortest chain of nodes leading from source to destination,
+        including both ends, or None if destination is not downstream of source.
+        
+        :rtype: `PyNode` list
+        """
+    
+        pass
+    
+    
+    def refresh(self):
+        """
+        Discard the captured connections and capture them again
+        """
+    
+        pass
+    
+    
+    def startTrack(self):
+        """
+        Install node added / removed and attribute connection callbacks which update
+        the snapshot incrementally
+        """
+    
+        pass
+    
+    
+    def upstream(self, node, depth=None):
+        """
+        Returns the nodes feeding the given node or attribute, breadth first.
+        
+        :Parameters:
+        depth : `int` or None
+            the maximum number of connections to follow; if None, there is no limit
+        
+        :rtype: `PyNode` list
+        """
+    
+        pass
+    
+    
+    __dict__ = None
+    
+    __weakref__ = None
+
+
+class _PyNodeCache(object):
+    """
+    A cache of constructed PyNodes, keyed by the node's ``MObjectHandle.hashCode()``
+    and, for name lookups, by its unique name: the full path of a dag node, or the
+    name of a dg node.
+    
+    Short and partial dag names are never used as keys, as what they resolve to
+    changes when a node of the same name is added elsewhere in the hierarchy (the
+    lookup must then raise as ambiguous), so PyNode('child') always goes through the
+    regular lookup.
+    
+    An `MObject` lookup only hits the cache if the cached node's `MObjectHandle` is
+    equal (``==``) to the handle of the given `MObject`, since hash codes are not
+    unique, and never for instanced dag nodes, with more than one dag path: which
+    path PyNode(mobj) gets is then left to `_pathFromMObj`, as without the cache.
+    
+    Entries are held in an LRU ordered dict of at most `maxSize` items, with the
+    PyNodes themselves held by weak reference, so that the cache never keeps a node
+    alive on its own.  Entries are dropped when the node is renamed or deleted, and,
+    for a dag node, along with those of all its descendants when it is reparented or
+    when it or one of its ancestors is renamed, since their full paths change (see
+    `pymel.core._installCallbacks`); or when their `MObjectHandle` is no longer
+    valid.
+    """
+    
+    
+    
+    def __contains__(self, key):
+        pass
+    
+    
+    def __init__(self, maxSize=10000):
+        pass
+    
+    
+    def __len__(self):
+        pass
+    
+    
+    def add(self, pynode, name=None):
+        """
+        Store a PyNode under the hash code of its `MObjectHandle`, and the given name
+        if it is the unique name of the node (full dag path or dg node name)
+        """
+    
         pass
     
     
-    def __exit__(self, exctype, excval, exctb):
+    def clear(self):
         pass
     
     
-    def __init__(self):
+    def get(self, name):
+        """
+        Return the cached PyNode for the given full dag path or dg node name, or None if
+        there is no valid entry for it
+        """
+    
         pass
     
     
-    def endTrack(self):
+    def getFromMObject(self, mobj):
         """
-        Stop tracking and remove the callback
+        Return the cached PyNode for the given `MObject`, or None if there is no entry
+        whose `MObjectHandle` equals that of mobj, or if mobj is an instanced dag node
         """
     
         pass
     
     
-    def getNodes(self, returnType='PyNode'):
+    def invalidate(self, mobj):
         """
-        Return a list of maya objects as strings.
-        
-        Parameters
-        ----------
-        returnType : {'PyNode', 'str', 'MObject'}
+        Remove all entries for the given `MObject`
         """
     
         pass
     
     
-    def isTracking(self):
+    def invalidateHierarchy(self, mobj):
         """
-        Return True/False
+        Remove all entries for the given dag node `MObject` and for all its descendants
         """
     
         pass
     
     
-    def reset(self):
+    __dict__ = None
+    
+    __weakref__ = None
+
+
+class _AttrNameIndex(object):
+    """
+    Resolves attribute names on a single node with dict lookups.
+    
+    The static attribute names of the node's type come from
+    `apicache.getStaticAttrIndex`, and are shared by all nodes of that type; a
+    per-node overlay holds the dynamic attributes and aliases.  The overlay is
+    built on first use, and thrown away when attributes are added to, removed from
+    or aliased on the node (see `pymel.core._installCallbacks`).
+    """
+    
+    
+    
+    def __init__(self, mobj, mayaType):
         pass
     
     
-    def startTrack(self):
+    def invalidate(self):
+        """
+        Discard the dynamic attribute and alias overlay, so that it is rebuilt on the
+        next lookup
+        """
+    
+        pass
+    
+    
+    def resolve(self, name):
+        """
+        Return the long name of the attribute matching the given long name, short name
+        or alias, or None if there is no such attribute
+        """
+    
         pass
     
     
@@ -1017,6 +1484,16 @@ class Component(PyNode):
     
     
     def __apimfn__(self):
+        """
+        Get a ``maya.OpenMaya*.MFn*Component`` instance
+        
+        Components are usually short lived (``for v in mesh.vtx`` builds a new
+        MeshVertex for every v), so the function set is not cached on the
+        instance, but in _apiFnCache, keyed on the node's `MDagPath` and checked
+        against its `MObjectHandle` (with ``==``): all the components of the same
+        node share it.  It is rebuilt if the handle is no longer valid.
+        """
+    
         pass
     
     
@@ -1914,6 +2391,11 @@ class Attribute(PyNode):
     
     
     def __getattr__(self, attr):
+        """
+        Looks up attr as a child of this attribute, eg. ``node.translate.tx``.  Like `attr`, the
+        long name, short name or alias is resolved by the node's `_AttrNameIndex`.
+        """
+    
         pass
     
     
@@ -2039,6 +2521,8 @@ class Attribute(PyNode):
     
     def attr(self, attr):
         """
+        Names are resolved through the node's `_AttrNameIndex`.
+        
         :rtype: `Attribute`
         """
     
@@ -3848,10 +4332,26 @@ class MItComponent(Component):
     
     
     def __apimfn__(self):
+        """
+        Get the ``MFn*`` function set of the node (ie, an MFnMesh for mesh
+        components), shared by all the components of the node through
+        _apiFnCache, as for `Component.__apimfn__`
+        """
+    
         pass
     
     
     def __apimit__(self, alwaysUnindexed=False):
+        """
+        Get a ``MIt*`` iterator over this component
+        
+        For a component with a single index, as built by ``for v in mesh.vtx``,
+        the node-wide iterator kept in _apiFnCache next to the function set is
+        moved to that index with setIndex, rather than building a new iterator
+        over a new component `MObject`.  Other components get their own
+        iterator.
+        """
+    
         pass
     
     
@@ -4058,6 +4558,72 @@ class Component2DFloat(ContinuousComponent):
 
 
 class Component1D(DiscreteComponent):
+    def __and__(self, other):
+        """
+        Returns a component of the same type, holding the indices found in both
+        components.  Computed on the components' `ComponentIndexSet` forms.
+        """
+    
+        pass
+    
+    
+    def __contains__(self, item):
+        """
+        Tests whether an index, or every index of another component of the same type
+        on the same node, is contained in this component, without expanding either
+        one into individual components.
+        
+        :rtype: `bool`
+        """
+    
+        pass
+    
+    
+    def __iter__(self):
+        """
+        Iterates over the single-index components of this component, walking its
+        `ComponentIndexSet` rather than a materialized list of indices
+        """
+    
+        pass
+    
+    
+    def __len__(self):
+        """
+        The number of indices in this component, read from its `ComponentIndexSet`
+        """
+    
+        pass
+    
+    
+    def __or__(self, other):
+        """
+        Returns a component of the same type, holding the indices found in either
+        component.  Computed on the components' `ComponentIndexSet` forms.
+        """
+    
+        pass
+    
+    
+    def __sub__(self, other):
+        """
+        Returns a component of the same type, holding the indices of this component
+        that are not in the other.  Computed on the components' `ComponentIndexSet`
+        forms.
+        """
+    
+        pass
+    
+    
+    def __xor__(self, other):
+        """
+        Returns a component of the same type, holding the indices found in exactly one
+        of the two components.  Computed on the components' `ComponentIndexSet` forms.
+        """
+    
+        pass
+    
+    
     def currentItem(self):
         pass
     
@@ -4082,6 +4648,20 @@ class Component1D(DiscreteComponent):
         pass
     
     
+    def indexSet(self):
+        """
+        The indices contained by this component, as a `ComponentIndexSet`.
+        
+        The set is built directly from ``MFnSingleIndexedComponent.getElements``, and
+        cached on the component, so no `ComponentIndex` or `HashableSlice` object is
+        created per element.
+        
+        :rtype: `ComponentIndexSet`
+        """
+    
+        pass
+    
+    
     def indicesIter(self):
         """
         An iterator over all the indices contained by this component,
@@ -4677,6 +5257,48 @@ class MeshVertex(MItComponent1D):
         pass
     
     
+    def getNormalsArray(self, space='preTransform'):
+        """
+        Return the averaged normals of all the vertices in this component, as an
+        (N, 3) ``float64`` numpy array, in the order of `indices`.
+        
+        Filled in one pass from ``MFnMesh.getVertexNormals``.  Requires numpy.
+        
+        :Parameters:
+            space : `Space.Space`
+                The transformation space.
+        
+                values: 'transform', 'preTransform', 'object', 'world'
+        
+        
+        :rtype: `numpy.ndarray`
+        """
+    
+        pass
+    
+    
+    def getPointsArray(self, space='preTransform'):
+        """
+        Return the positions of all the vertices in this component, as an (N, 3)
+        ``float64`` numpy array, in the order of `indices`.
+        
+        The array is filled in one pass from ``MFnMesh.getRawPoints`` (object space) or
+        an `MFloatPointArray` (other spaces), without creating a `Point` per vertex.
+        Requires numpy.
+        
+        :Parameters:
+            space : `Space.Space`
+                The transformation space.
+        
+                values: 'transform', 'preTransform', 'object', 'world'
+        
+        
+        :rtype: `numpy.ndarray`
+        """
+    
+        pass
+    
+    
     def getPosition(self, space='preTransform'):
         """
         Return the position of the current vertex in the specified space. Object space ignores all transformations for the polygon, world space includes all such transformations.
@@ -4860,6 +5482,25 @@ class MeshVertex(MItComponent1D):
         pass
     
     
+    def setPointsArray(self, points, space='preTransform'):
+        """
+        Set the positions of all the vertices in this component from an (N, 3) array,
+        in the order of `indices`, with a single ``MFnMesh.setPoints`` call.
+        Requires numpy.
+        
+        :Parameters:
+            points : `numpy.ndarray`
+                Array of shape (N, 3), where N is the number of vertices in this
+                component
+            space : `Space.Space`
+                The transformation space.
+        
+                values: 'transform', 'preTransform', 'object', 'world'
+        """
+    
+        pass
+    
+    
     def setPosition(self, point, space='preTransform'):
         """
         Set the position of the current vertex in the given space.
@@ -5031,6 +5672,24 @@ class MeshFace(MItComponent1D):
         pass
     
     
+    def getBoundingBoxArray(self, space='preTransform'):
+        """
+        Return the bounding box of every face in this component, as a `BoundingBoxArray`, in the
+        order of `indices`; computed in one pass over the mesh points
+        
+        :Parameters:
+            space : `Space.Space`
+                The transformation space.
+        
+                values: 'transform', 'preTransform', 'object', 'world'
+        
+        
+        :rtype: `BoundingBoxArray`
+        """
+    
+        pass
+    
+    
     def getColor(self, colorSetName=None):
         """
         This method gets the average color of the all the vertices in this face
@@ -5113,6 +5772,20 @@ class MeshFace(MItComponent1D):
         pass
     
     
+    def getFaceVertexCountsAndIndices(self):
+        """
+        Return the topology of the faces in this component as a pair of ``int32``
+        numpy arrays: the number of vertices of each face, and the flattened vertex
+        indices of all the faces.
+        
+        Filled in one pass from ``MFnMesh.getVertices``.  Requires numpy.
+        
+        :rtype: (`numpy.ndarray`, `numpy.ndarray`)
+        """
+    
+        pass
+    
+    
     def getNormal(self, space='preTransform'):
         """
         Return the face normal of the current polygon.
@@ -5323,6 +5996,25 @@ class MeshFace(MItComponent1D):
         pass
     
     
+    def getUVsArray(self, uvSet=None):
+        """
+        Return the uvs of all the face-vertices of the faces in this component, as an
+        (N, 2) ``float64`` numpy array, ordered face by face as in
+        `getFaceVertexCountsAndIndices`.
+        
+        Filled in one pass from ``MFnMesh.getUVs`` and ``MFnMesh.getAssignedUVs``.
+        Requires numpy.
+        
+        :Parameters:
+            uvSet : `unicode`
+                UV set to work with; if None, the current uv set is used
+        
+        :rtype: `numpy.ndarray`
+        """
+    
+        pass
+    
+    
     def getVertices(self):
         """
         This method gets the indices of the vertices of the current face
@@ -7013,6 +7705,34 @@ def setAttr(attr, *args, **kwargs):
     pass
 
 
+def setAttrs(attrValues, **kwargs):
+    """
+    Sets the values of many attributes at once.
+    
+    The attributes are grouped by their plug data type, and all of the writes are
+    queued on a single `MDGModifier` and committed with one doIt, so the dependency
+    graph is dirtied once for the whole batch.  The modifier is registered with
+    `factories.apiUndo` as a single `ApiModifierUndoItem`, so one undo reverts every
+    value that was set.
+    
+        >>> import pymel.core as pm
+        >>> cube = pm.polyCube()[0]
+        >>> pm.setAttrs({cube.tx: 1.0, cube.ty: 2.0, cube.visibility: False})
+        >>> cube.t.get()
+        dt.Vector([1.0, 2.0, 0.0])
+    
+    :Parameters:
+    attrValues : `dict` or iterable of (attr, value) pairs
+        the attributes to set, and the values to set them to.  Attributes may be
+        given as `Attribute` objects or as strings
+    unlock : `bool`
+        if True, locked attributes are unlocked, set, and locked again; otherwise
+        setting a locked attribute raises before any value is set
+    """
+
+    pass
+
+
 def curveRGBColor(*args, **kwargs):
     """
     This command creates, changes or removes custom curve colors, which are used to draw the curves in the Graph Editor. The
@@ -8533,6 +9253,53 @@ def suitePrefs(*args, **kwargs):
     pass
 
 
+def enablePyNodeCache(maxSize=10000):
+    """
+    Turn on caching of PyNode construction.
+    
+    While enabled, constructing a `PyNode` from a name or `MObject` that has already
+    been seen returns the previously built instance, skipping name parsing, type
+    lookup and virtual class resolution.  The cache is keyed by the node's
+    ``MObjectHandle.hashCode()`` and, for names, by full dag paths and dg node names
+    only: short dag names are always looked up in the scene, so that they raise when
+    they become ambiguous.  `MObject` lookups compare `MObjectHandle` instances, not
+    just their hash codes, and are not cached for instanced dag nodes.  It is invalidated automatically when nodes are renamed,
+    reparented or deleted, including the descendants of a renamed or reparented dag
+    node.
+    
+    :Parameters:
+    maxSize : `int`
+        the maximum number of nodes to keep; the least recently used are dropped
+        first
+    """
+
+    pass
+
+
+def disablePyNodeCache():
+    """
+    Turn off caching of PyNode construction, and clear the cache.
+    """
+
+    pass
+
+
+def clearPyNodeCache():
+    """
+    Remove all entries from the PyNode construction cache.
+    """
+
+    pass
+
+
+def isPyNodeCacheEnabled():
+    """
+    :rtype: `bool`
+    """
+
+    pass
+
+
 def _getPymelType(arg, name):
     """
     Get the correct Pymel Type for an object that can be a MObject, PyNode or name of an existing Maya object,
@@ -8541,6 +9308,9 @@ def _getPymelType(arg, name):
     If the name of an existing object is passed, the name and MObject will be returned
     If a valid MObject is passed, the name will be returned as None
     If a PyNode instance is passed, its name and MObject will be returned
+    
+    The class for the node type is created by `factories.getPyNodeClass` if it
+    was not accessed yet.
     """
 
     pass
@@ -8554,6 +9324,28 @@ def _pathFromMObj(mObj, fullPath=False):
     pass
 
 
+def _listRelativesApi(nodes, children=False, allDescendents=False, shapes=False, parent=False, type=None, noIntermediate=False, fullPath=True):
+    """
+    API implementation of `listRelatives`, used when only the flags it supports
+    are passed.
+    
+    Walks the `MDagPath` of each node with `MFnDagNode` (or `MItDag`, for
+    allDescendents), filters by intermediate state and by maya type, and builds
+    each PyNode directly from its path, as `_pathFromMObj` would.
+    
+    The type filter compares maya type names, a relative matching if type is its
+    own type or one of its ancestors in `apicache.getInheritance`.  The api type
+    is only used as a cheap pre-filter, when type maps to a single api type of its
+    own: plugin types share kPluginShape, kPluginDependNode, etc., and abstract
+    maya types do not map one to one onto MFn types, so for those every relative
+    goes through the maya type comparison.
+    
+    :rtype: `DependNode` list
+    """
+
+    pass
+
+
 def vnn(*args, **kwargs):
     """
     This command is used for operations that apply to a whole VNN runtime, for example Bifrost.  The Create Node window uses
@@ -11718,6 +12510,36 @@ def getAttr(attr, default=None, **kwargs):
     pass
 
 
+def getAttrs(attrs, asNumpy=False, asDict=False):
+    """
+    Returns the values of many attributes at once.
+    
+    The passed attributes are resolved to plugs a single time, grouped by their
+    data type, and read in one `MPlug` pass, bypassing the per-call command
+    dispatch of `getAttr`.  Numeric values are returned as plain python types
+    (or `datatypes` objects for vector and matrix compounds), exactly as `getAttr`
+    would return them.
+    
+        >>> import pymel.core as pm
+        >>> pm.getAttrs(['persp.tx', 'persp.ty', 'persp.visibility'])
+        [28.0, 21.0, True]
+    
+    :Parameters:
+    attrs : iterable of `Attribute` or `str`
+        the attributes to read
+    asNumpy : `bool`
+        if True, and numpy is available, return a single ``float64`` array
+        holding the flattened numeric values, instead of a list.  Raises a
+        TypeError if any of the attributes is not numeric
+    asDict : `bool`
+        if True, return a dict mapping each `Attribute` to its value
+    
+    :rtype: `list`
+    """
+
+    pass
+
+
 def objExists(*args, **kwargs):
     """
     This command simply returns true or false depending on whether an object with the given name exists.
@@ -14797,6 +15619,9 @@ def hasAttr(pyObj, attr, checkShape=True):
     convenience function for determining if an object has an attribute.
     If checkShape is enabled, the shape node of a transform will also be checked for the attribute.
     
+    Long names, short names and aliases are all resolved with a single lookup in
+    the node's `_AttrNameIndex`, rather than one maya query per kind of name.
+    
     :rtype: `bool`
     """
 
@@ -17651,6 +18476,11 @@ def listRelatives(*args, **kwargs):
             no args and nothing is selected (would formerly raise a TypeError)
       - returns wrapped classes
       - fullPath is forced on to ensure that all returned node paths are unique
+      - when only the children, allDescendents, shapes, parent, type, noIntermediate and fullPath
+            flags are used, relatives are found with `MFnDagNode` and wrapped straight from their
+            `MDagPath`, skipping the command call and the name lookup for each result; type is
+            matched on maya type names and their inheritance, so plugin and abstract types give
+            the same results as the command
     
         :rtype: `DependNode` list
     
@@ -18617,6 +19447,9 @@ def ls(*args, **kwargs):
         their dag paths (ie, two different instances of the same object will result
         in two unique PyNodes)
       - Added new keyword: 'editable' - this will return the inverse set of the readOnly flag. i.e. non-read-only nodes
+      - Added new keyword: 'iterate' - if True, return a generator, as `iterLs` does, instead of a list.
+        If flags that `iterLs` does not support are also given, the ls command is run as usual and the
+        generator iterates over its result, in `ls` order
       - Added new keyword: 'regex' - pass a valid regular expression string, compiled regex pattern, or list thereof.
     
             >>> group('top')
@@ -19094,6 +19927,38 @@ def ls(*args, **kwargs):
     pass
 
 
+def iterLs(*args, **kwargs):
+    """
+    A generator version of `ls`, which yields PyNodes one at a time instead of
+    building the complete result list.
+    
+    Rather than calling the ls command, the scene is walked with `MItDag` (when
+    only dag objects can match) or `MItDependencyNodes`, or the active selection
+    list is walked, and each matching node is converted to a PyNode as it is
+    reached.  The loop can therefore stop at the first match without visiting the
+    rest of the scene:
+    
+        >>> import pymel.core as pm
+        >>> cam = next(n for n in iterLs(type='camera') if n.isOrtho())
+        >>> cam
+        nt.Camera(u'topShape')
+    
+    Nodes are yielded in the order of the iterator used, ie. dag order for
+    `MItDag` (persp, top, front, side for the default cameras), creation order
+    for `MItDependencyNodes` and selection order for the selection list, which
+    is not necessarily the order of the list returned by `ls`.
+    
+    The name patterns and the following flags of `ls` are supported: type,
+    exactType, dag, transforms, shapes, selection, long, allPaths, referencedNodes,
+    readOnly, editable and regex.  Any other flag raises a TypeError; use `ls` for
+    those.
+    
+        :rtype: `PyNode` generator
+    """
+
+    pass
+
+
 def toggleAxis(*args, **kwargs):
     """
     Toggles the state of the display axis. Note: the display of the axis in the bottom left corner has been rendered
@@ -20724,6 +21589,12 @@ CHECK_ATTR_BEFORE_LOCK = False
 
 _logger = None
 
+_pyNodeCache = None
+
+_attrNameIndexes = {}
+
+_apiFnCache = {}
+
 SCENE = Scene()
 
 with_statement = None
@@ -89,12 +89,15 @@ class ApiCache(startup.SubItemCache):
         pass
     
     
-    def rebuild(self):
+    def rebuild(self, processes=None):
         """
         Rebuild the api cache from scratch
         
         Unlike 'build', this does not attempt to load a cache file, but always
         rebuilds it by parsing the docs, etc.
+        
+        The api classes docs are parsed in parallel by `startup.parallelRebuild`,
+        using up to the given number of processes.
         """
     
         pass
@@ -132,6 +135,9 @@ class ApiCache(startup.SubItemCache):
     EXTRA_GLOBAL_NAMES = ()
     
     
+    INDEXED = True
+    
+    
     MAYA_TO_API_OVERRIDES = {}
     
     
@@ -250,6 +256,19 @@ def getInheritance(mayaType, checkManip3D=True, checkCache=True, updateCache=Tru
     pass
 
 
+def getStaticAttrIndex(mayaType, checkCache=True, updateCache=True):
+    """
+    Get a dict mapping every long and short name of the static attributes of the
+    given maya type to the attribute's long name.
+    
+    The names are read from `MNodeClass`, so no node needs to be created.  Results
+    are stored in `_cachedStaticAttrIndexes`, and, if updateCache is True, in the
+    api cache, so that later sessions can skip the query entirely.
+    """
+
+    pass
+
+
 def _getAllMayaTypes(**kwargs):
     pass
 
@@ -266,6 +285,15 @@ def _getAbstractMayaTypes(**kwargs):
     pass
 
 
+def _parseApiClasses(classNames, docLocation=None):
+    """
+    `startup.parallelRebuild` worker: parse the docs of the given api classes with
+    `parsers.ApiDocParser`, and return the partial apiClassInfo dict
+    """
+
+    pass
+
+
 
 _ABSTRACT_SUFFIX = ' (abstract)'
 
@@ -289,4 +317,6 @@ find = 'vert(?!(ex|ice))'
 
 _cachedInheritances = {}
 
+_cachedStaticAttrIndexes = {}
+
 
@@ -14,10 +14,13 @@ class CmdCache(startup.SubItemCache):
         pass
     
     
-    def rebuild(self):
+    def rebuild(self, processes=None):
         """
         Build and save to disk the list of Maya Python commands and their arguments
         
+        The command docs are parsed in parallel by `startup.parallelRebuild`, using up
+        to the given number of processes.
+        
         WARNING: will unload existing plugins, then (re)load all maya-installed
         plugins, without making an attempt to return the loaded plugins to the
         state they were at before this command is run.  Also, the act of
@@ -123,6 +126,15 @@ def getModuleCommandList(category, version=None):
     pass
 
 
+def _parseCommandDocs(commands, version):
+    """
+    `startup.parallelRebuild` worker: parse the docs of the given commands with
+    `parsers.CommandDocParser`, and return the partial cmdlist dict
+    """
+
+    pass
+
+
 
 cmdlistOverrides = {}
 
@@ -651,6 +651,33 @@ class ApiRedoUndoItem(ApiUndoItem):
         pass
 
 
+class ApiModifierUndoItem(ApiUndoItem):
+    """
+    An undo item that wraps an `MDGModifier` (or `MDagModifier`).
+    
+    Its doIt and redoIt call the modifier's doIt, and undoIt calls the modifier's
+    undoIt, so that any number of edits queued on a single modifier are undone and
+    redone as one item on the `apiUndo` queue.
+    """
+    
+    
+    
+    def __init__(self, modifier):
+        pass
+    
+    
+    def doIt(self):
+        pass
+    
+    
+    def redoIt(self):
+        pass
+    
+    
+    def undoIt(self):
+        pass
+
+
 class MetaMayaNodeWrapper(_MetaMayaCommandWrapper):
     """
     A metaclass for creating classes based on node type.  Methods will be added to the new classes
@@ -771,6 +798,26 @@ def addPyNodeCallback(dynModule, mayaType, pyNodeTypeName, parentPyNodeTypeName,
     pass
 
 
+def getPyNodeClass(mayaType, default=None):
+    """
+    Returns the PyNode class for the given maya node type, or default if the type has no PyNode class.
+    The class is fetched from the module it was added to by addPyNode, so that a class which has not
+    been accessed yet is created, along with its ancestors, by the module's addPyNodeCallback creator
+    """
+
+    pass
+
+
+def loadPyNodeClasses(dynModule=None):
+    """
+    Create all the PyNode classes added by addPyNode that have not been accessed yet, for the given
+    module or for all of them if dynModule is None; used when the whole hierarchy is needed, eg. by
+    pymel.all or to build the docs
+    """
+
+    pass
+
+
 def getComponentTypes():
     """
     # Keep around for debugging/info gathering...
@@ -1031,7 +1078,57 @@ def toPyNode(res):
     pass
 
 
-def createFunctions(moduleName, returnFunc=None):
+def createFunctions(moduleName, returnFunc=None, lazy=None):
+    """
+    Create the wrapped functions of the commands listed for moduleName in moduleCmds, for the
+    ones the module does not define itself.
+    
+    If lazy is True (by default, the 'lazy_functions' option of pymel.conf, which is off), no
+    function is built here: the command names are registered in _lazyFunctions, and the module
+    is replaced in sys.modules by a `pymel.util.utilitytypes.ModuleInterceptor`, which builds
+    each wrapper (functionFactory, command docs, flag fix-ups) the first time it is accessed as
+    an attribute, and sets it on the module so that it is only built once.  Names that
+    pymel.core re-exports from the module are resolved the same way.
+    
+    Star imports do not go through attribute access: ``from pymel.core import *`` and
+    ``from pymel.core.general import *`` only get the functions already built, and silently miss
+    the pending ones.  Listing them in __all__ would not help, as the star import would then
+    build every wrapper and lazy mode would save nothing.  This is why lazy mode is opt-in: it
+    is meant for code that only uses qualified names (``pm.ls``, ``pymel.core.general.ls``).
+    Code that needs the whole namespace, for a star import or for introspection, should call
+    loadLazyFunctions first.
+    """
+
+    pass
+
+
+def _createLazyFunction(module, funcName):
+    """
+    ModuleInterceptor callback of the modules set up by createFunctions in lazy mode: build the
+    wrapper of the command funcName, set it on its module and on pymel.core, and return it.
+    Raises AttributeError if funcName is not a pending command of the module.
+    """
+
+    pass
+
+
+def loadLazyFunctions(moduleName=None):
+    """
+    Build all the functions left pending by createFunctions in lazy mode, for the given module, or
+    for all the modules if moduleName is None
+    """
+
+    pass
+
+
+def freezeModule(moduleName):
+    """
+    Returns the python source recreating what the factories generated for the given module: its
+    wrapped functions, PyNode or ui classes and api method wrappers, with their docstrings and
+    ApiArgUtil metadata, in sorted order so that the result is reproducible.  Used by
+    `startup.PymelBundle` to build the frozen bundle.
+    """
+
     pass
 
 
@@ -1280,6 +1377,10 @@ apiClassNamesToPyNodeNames = {}
 
 moduleCmds = {}
 
+_lazyFunctions = {}
+
+_frozen = False
+
 _logger = None
 
 
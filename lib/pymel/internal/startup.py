@@ -13,6 +13,9 @@ import maya.OpenMaya as om
 import inspect
 import cPickle as pickle
 import os
+import multiprocessing
+import imp
+import marshal
 
 from pymel.versions import installName
 from pymel.util.common import subpackages
@@ -28,10 +31,30 @@ class PymelCache(object):
     
     
     def read(self):
+        """
+        Read the cache file.
+        
+        If INDEXED is set and an indexed cache file exists, it is memory-mapped and only its
+        header table is read.  Data written from a dictionary is returned as a
+        `pymel.util.picklezip.IndexedPickle`, decoded entry by entry as it is used.  Data
+        written from a tuple, as SubItemCache.save does with contents(), is returned as a tuple
+        of the same length (see `IndexedPickle.asTuple`), whose dictionary items are plain
+        dicts, so that it can be passed to SubItemCache.update as a regular cache file is.
+        Otherwise the whole pickle is loaded.
+        """
+    
         pass
     
     
     def write(self, data):
+        """
+        Write data to the cache file, in the indexed format if INDEXED is set
+        
+        An IndexedPickle still mapping the file from an earlier read is detached
+        first (see `pymel.util.picklezip.detachIndexed`), as a mapped file cannot be
+        replaced on Windows.
+        """
+    
         pass
     
     
@@ -45,6 +68,9 @@ class PymelCache(object):
     DESC = ''
     
     
+    INDEXED = False
+    
+    
     NAME = ''
     
     
@@ -122,6 +148,10 @@ class SubItemCache(PymelCache):
         
         If it succeeds, it will update itself, and return the loaded items;
         if it fails, it will return None
+        
+        For INDEXED caches, read returns a tuple of plain items (see
+        `PymelCache.read`), which update converts to their ITEM_TYPES types as usual:
+        the loaded items are the same as with a regular cache file.
         """
     
         pass
@@ -170,6 +200,79 @@ class SubItemCache(PymelCache):
 
 
 
+class PymelBundle(PymelCache):
+    """
+    A "frozen" pymel: the fully generated state of the pymel.core modules for one maya version
+    (wrapped command functions, PyNode and ui classes, api method wrappers and their ApiArgUtil
+    metadata), saved as marshalled code objects in a single file.
+    
+    When a valid bundle exists, importing pymel.core executes its code objects instead of reading
+    the api / cmd caches and running the factories. The bundle is rebuilt with build, eg. as part
+    of deploying pymel for a maya version:
+    
+        >>> bundle = PymelBundle()
+        >>> bundle.build()       # doctest: +SKIP
+        >>> bundle.isValid()     # doctest: +SKIP
+        True
+    
+    The code of every module is generated from sorted names and contains no timestamps or memory
+    addresses, so building twice from the same caches gives identical files; this also allows
+    building and testing the bundle against the stub maya.cmds, without a maya session.
+    """
+    
+    
+    
+    def build(self, moduleNames=None):
+        """
+        Run the factories for the given modules (by default, MODULES), generate their code with
+        `factories.freezeModule` and write the bundle, with the validity key checked by isValid.
+        The bundle path includes the python version, so that each mayapy of a maya version
+        builds and loads its own bundle
+        """
+    
+        pass
+    
+    
+    def isValid(self):
+        """
+        Returns True if the bundle exists and its key matches this process: pymel version, maya
+        version, the current caches, and the python interpreter (sys.version_info and
+        imp.get_magic()), as marshal data only loads in the python version that wrote it and maya
+        may ship several mayapy interpreters (eg. python 2 and 3 for maya 2022)
+        """
+    
+        pass
+    
+    
+    def load(self):
+        """
+        Install the modules of the bundle in sys.modules, and return True; return False, without
+        side effects, if the bundle is missing or not valid, or if marshal.loads fails on it
+        (ValueError, EOFError or TypeError, eg. for a truncated file), in which case the modules
+        are generated as usual
+        """
+    
+        pass
+    
+    
+    COMPRESSED = False
+    
+    
+    DESC = 'the frozen pymel bundle'
+    
+    
+    FORMAT_VERSION = 1
+    
+    
+    MODULES = ('pymel.core.general', 'pymel.core.animation', 'pymel.core.context', 'pymel.core.effects', 'pymel.core.language', 'pymel.core.modeling', 'pymel.core.other', 'pymel.core.rendering', 'pymel.core.system', 'pymel.core.windows', 'pymel.core.nodetypes', 'pymel.core.uitypes')
+    
+    
+    NAME = 'mayaBundle'
+    
+    
+    USE_VERSION = True
+
+
 def initMEL():
     pass
 
@@ -251,6 +354,32 @@ def _dump(data, filename, protocol=-1):
     pass
 
 
+def _loadIndexed(filename):
+    pass
+
+
+def _dumpIndexed(data, filename, protocol=-1):
+    pass
+
+
+def parallelRebuild(worker, items, processes=None, chunkSize=None):
+    """
+    Run worker over items in a multiprocessing pool, and merge the results.
+    
+    items are sorted and split into chunks of chunkSize items (by default, enough chunks to keep
+    every process busy); worker is called with each chunk and must return a dict, and must be
+    defined at module level so that it can be pickled.  The dicts are merged with
+    `pymel.util.mergeCascadingDicts` in chunk order, not in completion order, so the result does
+    not depend on the number of processes or on scheduling.
+    
+    processes defaults to the number of cores.  If it is 1, or if the pool cannot be started (eg.
+    inside a gui maya session), the chunks are processed serially in this process, with the same
+    result.
+    """
+
+    pass
+
+
 def getConfigFile():
     pass
 
@@ -71,6 +71,14 @@ class Array(object):
     >>> list(A)
     [Array([1, 2, 3]), Array([4, 5, 6]), Array([7, 8, 9])]
     
+    If numpy is available, the storage can be switched to a single ``ndarray`` per Array
+    with `setBackend`. Elementwise arithmetic, dot, cross, outer, det, inv, sum, prod,
+    length and normal are then computed by numpy, while the public interface, including
+    the data property and the results shown here, stays the same.
+    
+    >>> getBackend()
+    'list'
+    
     Initialization from another Array does a shallow copy, not a deepcopy,
     unless the Array argument is resized / reshaped.
     
@@ -173,6 +181,10 @@ class Array(object):
         ...
     TypeError: cannot initialize a Array of shape (2, 2) from [1, 2, 3, 4, 5] of shape (5,),
     as it would truncate data or reduce the number of dimensions
+    
+    The in place operators (+=, -=, *=, /=...) update the components of an Array in its existing
+    storage: no new storage is allocated when the other operand is a scalar or fits the shape of
+    the Array.
     """
     
     
@@ -1042,6 +1054,11 @@ class Array(object):
     def __reduce__(self):
         """
         __reduce__ is defined to allow pickling of Arrays
+        
+        Arrays whose components are all floats are reduced to their shape and a packed buffer of
+        doubles (see tobytes), instead of nested lists, which makes pickles of large Arrays much
+        smaller and faster to load. Any other Array, holding ints, longs, bools, complex or non
+        numeric values, is still reduced to nested lists, so that it round-trips exactly.
         """
     
         pass
@@ -1531,13 +1548,15 @@ class Array(object):
         pass
     
     
-    def blend(self, other, weight=0.5):
+    def blend(self, other, weight=0.5, out=None):
         """
-        a.blend(b[, weight=0.5]) <==> blend(a, b[, weights=0.5])
+        a.blend(b[, weight=0.5[, out=None]]) <==> blend(a, b[, weights=0.5[, out=None]])
         
         Returns the result of blending from Array instance u to v according to
         either a scalar weight where blend will yield a*(1-weight) + b*weight Array,
         or a an iterable of independent weights.
+        If out is given, it must be an Array of the shape of the result, which is written into it
+        and returned, instead of allocating a new Array
         
         >>> A = Array(0, shape=(2, 2))
         >>> print A.formated()
@@ -1564,12 +1583,14 @@ class Array(object):
         pass
     
     
-    def clamp(self, low=0, high=1):
+    def clamp(self, low=0, high=1, out=None):
         """
-        a.clamp([low=0[, high=1]]) <==> clamp (a, low, high)
+        a.clamp([low=0[, high=1[, out=None]]]) <==> clamp (a, low, high[, out=None])
         
         Returns the result of clamping each component of a between low and high if low and high are scalars,
         or the corresponding components of low and high if low and high are sequences of scalars
+        If out is given, it must be an Array of the shape of the result, which is written into it
+        and returned, instead of allocating a new Array
         
         >>> A = Array(range(4), shape=(2, 2))
         >>> print A.formated()
@@ -2044,6 +2065,41 @@ class Array(object):
         pass
     
     
+    def fromNumpy(cls, value):
+        """
+        cls.fromNumpy(ndarray) --> cls
+        
+        Creates a new instance of cls from a numpy ndarray. With the 'numpy' backend the ndarray
+        is used as storage directly, without copying it.
+        
+        >>> import numpy
+        >>> print Array.fromNumpy(numpy.array([[1, 2], [3, 4]])).formated()
+        [[1, 2],
+         [3, 4]]
+        """
+    
+        pass
+    
+    
+    def frombytes(cls, data, shape=None):
+        """
+        cls.frombytes(data[, shape]) --> cls
+        
+        Creates a new instance of cls from a string of packed little endian doubles, as returned by
+        tobytes. If shape is not given, the class default shape is used, or a one dimensional Array
+        of all the values if the class has none. The components of the result are always floats.
+        
+        >>> A = Array([[1.0, 2.0], [3.0, 4.0]])
+        >>> print Array.frombytes(A.tobytes(), shape=(2, 2)).formated()
+        [[1.0, 2.0],
+         [3.0, 4.0]]
+        
+        Related : see Array.tobytes method.
+        """
+    
+        pass
+    
+    
     def get(self):
         """
         a.get() --> Tuple
@@ -2245,11 +2301,13 @@ class Array(object):
         pass
     
     
-    def normal(self, *args):
+    def normal(self, *args, **kwargs):
         """
-        a.normal(axis0, axis1, ...) <==> normal(a[, axis=(axis0, axis1, ...)])
+        a.normal(axis0, axis1, ...[, out=None]) <==> normal(a[, axis=(axis0, axis1, ...)[, out=None]])
         
         Returns a normalized copy of self: self/self.length(axis0, axis1, ...).
+        If out is given, it must be an Array of the shape of the result, which is written into it
+        and returned, instead of allocating a new Array
         
         >>> A = Array([[0.5,0.5,-0.707],[0.707,-0.707,0.0]])
         >>> print A.formated()
@@ -2895,6 +2953,40 @@ class Array(object):
         pass
     
     
+    def toNumpy(self):
+        """
+        a.toNumpy() --> ndarray
+        
+        Returns the content of a as a numpy ndarray of the same shape. With the 'numpy' backend
+        this is the Array's own storage, not a copy, so changes made to it are seen by a.
+        
+        >>> A = Array([[1, 2], [3, 4]])
+        >>> A.toNumpy()
+        array([[1, 2],
+               [3, 4]])
+        """
+    
+        pass
+    
+    
+    def tobytes(self):
+        """
+        a.tobytes() --> str
+        
+        Returns the components of a, in row major order, packed as little endian doubles. Integer
+        and bool components are converted to float, and complex components raise a TypeError; use
+        pickle to keep their type.
+        
+        >>> A = Array([[1.0, 2.0], [3.0, 4.0]])
+        >>> len(A.tobytes())
+        32
+        
+        Related : see Array.frombytes method.
+        """
+    
+        pass
+    
+    
     def tolist(self):
         """
         a.tolist() --> list
@@ -4345,11 +4437,13 @@ class VectorN(Array):
         pass
     
     
-    def cross(self, other):
+    def cross(self, other, out=None):
         """
-        u.cross(v) <==> cross(u, v)
+        u.cross(v[, out=None]) <==> cross(u, v[, out=None])
         
         cross product of u and v, u and v should be 3 dimensional vectors.
+        If out is given, it must be a 3 dimensional VectorN, the result is written into it and
+        returned, instead of allocating a new VectorN
         """
     
         pass
@@ -4385,12 +4479,13 @@ class VectorN(Array):
         pass
     
     
-    def normal(self):
+    def normal(self, out=None):
         """
-        u.normal() --> VectorN
+        u.normal([out=None]) --> VectorN
         
         Returns a normalized copy of self. Overriden to be consistant with Maya API and MEL unit command,
         does not raise an exception if self if of zero length, instead returns a copy of self
+        If out is given, the result is written into it and returned, instead of allocating a new VectorN
         """
     
         pass
@@ -4684,6 +4779,9 @@ def hermiteInterp(*args, **kwargs):
         :rtype: float
         
     This function has been overriden from pymel.util.mathutils.hermiteInterp to work element-wise on iterables
+    Array and flat numeric sequence arguments are processed in a single call to
+    pymel.util.mathutils.hermiteInterpBuffer, and the result
+    is re-wrapped into the widest Array type of the arguments
     """
 
     pass
@@ -5014,11 +5112,13 @@ def axis(a, b, c=None, normalize=False):
     pass
 
 
-def normal(a, axis=None):
+def normal(a, axis=None, out=None):
     """
-    normal(a[, axis=(axis0, axis1, ...)]) --> Array
+    normal(a[, axis=(axis0, axis1, ...)[, out=None]]) --> Array
     
     Returns a normalized copy of self: self/length(self, axis).
+    If out is given, it must be an Array of the shape of the result, which is written into it and
+    returned, instead of allocating a new Array.
     
     >>> A = Array([[0.5,0.5,-0.707],[0.707,-0.707,0.0]])
     >>> print A.formated()
@@ -5081,6 +5181,38 @@ def blend(*args, **kwargs):
         :rtype: float
         
     This function has been overriden from pymel.util.mathutils.blend to work element-wise on iterables
+    Array and flat numeric sequence arguments are processed in a single call to
+    pymel.util.mathutils.blendBuffer, and the result
+    is re-wrapped into the widest Array type of the arguments
+    An out keyword argument can be given, as for blendBuffer, to write the result into an
+    existing Array instead of allocating a new one
+    """
+
+    pass
+
+
+def setBackend(name):
+    """
+    setBackend(name)
+    
+    Selects the storage used by Arrays created from now on: 'list' stores data as nested lists
+    (the default, always available), 'numpy' stores it as a numpy ndarray and dispatches
+    arithmetic and the dot, cross, outer, det, inv, sum, prod, length and normal functions to
+    numpy. Raises an ImportError if 'numpy' is requested and numpy cannot be imported.
+    
+    Related : see getBackend.
+    """
+
+    pass
+
+
+def getBackend():
+    """
+    getBackend() --> str
+    
+    Returns the name of the storage currently used for new Arrays, 'list' or 'numpy'.
+    
+    Related : see setBackend.
     """
 
     pass
@@ -5121,6 +5253,9 @@ def smoothstep(*args, **kwargs):
         :rtype: float
         
     This function has been overriden from pymel.util.mathutils.smoothstep to work element-wise on iterables
+    Array and flat numeric sequence arguments are processed in a single call to
+    pymel.util.mathutils.smoothstepBuffer, and the result
+    is re-wrapped into the widest Array type of the arguments
     """
 
     pass
@@ -5136,6 +5271,9 @@ def linstep(*args, **kwargs):
         :rtype: float
         
     This function has been overriden from pymel.util.mathutils.linstep to work element-wise on iterables
+    Array and flat numeric sequence arguments are processed in a single call to
+    pymel.util.mathutils.linstepBuffer, and the result
+    is re-wrapped into the widest Array type of the arguments
     """
 
     pass
@@ -5173,6 +5311,9 @@ def smoothmap(*args, **kwargs):
         :rtype: float
         
     This function has been overriden from pymel.util.mathutils.smoothmap to work element-wise on iterables
+    Array and flat numeric sequence arguments are processed in a single call to
+    pymel.util.mathutils.smoothmapBuffer, and the result
+    is re-wrapped into the widest Array type of the arguments
     """
 
     pass
@@ -5185,6 +5326,9 @@ def setRange(*args, **kwargs):
         :rtype: float
         
     This function has been overriden from pymel.util.mathutils.setRange to work element-wise on iterables
+    Array and flat numeric sequence arguments are processed in a single call to
+    pymel.util.mathutils.setRangeBuffer, and the result
+    is re-wrapped into the widest Array type of the arguments
     """
 
     pass
@@ -5215,6 +5359,9 @@ def hermite(*args, **kwargs):
     
         
     This function has been overriden from pymel.util.mathutils.hermite to work element-wise on iterables
+    Array and flat numeric sequence arguments are processed in a single call to
+    pymel.util.mathutils.hermiteBuffer, and the result
+    is re-wrapped into the widest Array type of the arguments
     """
 
     pass
@@ -5270,6 +5417,11 @@ def clamp(*args, **kwargs):
         :rtype: float
         
     This function has been overriden from pymel.util.mathutils.clamp to work element-wise on iterables
+    Array and flat numeric sequence arguments are processed in a single call to
+    pymel.util.mathutils.clampBuffer, and the result
+    is re-wrapped into the widest Array type of the arguments
+    An out keyword argument can be given, as for clampBuffer, to write the result into an
+    existing Array instead of allocating a new one
     """
 
     pass
@@ -5419,6 +5571,13 @@ def erf(*args, **kwargs):
 def _patchfn(basefn):
     """
     Overload the given base function to have it accept iterables
+    
+    If pymel.util.mathutils.bufferFunctions holds a whole-buffer version of basefn, the
+    overloaded function passes Array and flat sequence arguments to it in a single call,
+    rather than calling basefn once per element.  As the buffer functions return the kind
+    of their first buffer argument, the result is then re-wrapped into the widest Array
+    type of the arguments, as the element-wise path does: blend([0, 0], [1, 1]) still
+    returns an Array, and blend of two Vectors a Vector
     """
 
     pass
@@ -5494,11 +5653,13 @@ def copysign(*args, **kwargs):
     pass
 
 
-def cross(u, v):
+def cross(u, v, out=None):
     """
-    cross(u, v) --> VectorN
+    cross(u, v[, out=None]) --> VectorN
     
     Returns the cross product of u and v, u and v should be 3 dimensional vectors.
+    If out is given, it must be an Array of the shape of the result, which is written into it and
+    returned, instead of allocating a new Array.
     
     >>> u = VectorN(1.0, 0.0, 0.0)
     >>> v = VectorN(0.0, 1.0, 0.0)
@@ -5563,4 +5724,8 @@ eps = 9.313225746154785e-10
 
 pi = 3.141592653589793
 
+BACKENDS = ('list', 'numpy')
+
+_backend = 'list'
+
 
@@ -0,0 +1,97 @@
+"""
+Bounding volume hierarchy of axis aligned bounding boxes, for overlap, nearest and ray queries
+on large sets of boxes.
+"""
+
+import operator
+import heapq
+
+class AABBTree(object):
+    """
+    A bounding volume hierarchy of axis aligned bounding boxes.
+    
+    The tree is built once, top down, from a sequence of boxes, splitting each node at the median
+    of the longest axis of its box, and answers queries in O(log n) instead of comparing every box
+    with every other. Boxes can be given as pymel.core.datatypes.BoundingBox objects, as a
+    BoundingBoxArray, or as plain ((minx, miny, minz), (maxx, maxy, maxz)) pairs; queries return
+    the indices of the boxes in that sequence, or the items given with them.
+    
+        >>> boxes = [((0, 0, 0), (1, 1, 1)), ((2, 2, 2), (3, 3, 3)), ((10, 0, 0), (11, 1, 1))]
+        >>> tree = AABBTree(boxes, items=['a', 'b', 'c'])
+        >>> sorted(tree.overlapping(((0.5, 0.5, 0.5), (2.5, 2.5, 2.5))))
+        ['a', 'b']
+        >>> tree.nearest((9, 0, 0))
+        'c'
+        >>> tree.raycast((-1, 0.5, 0.5), (1, 0, 0))
+        ['a', 'c']
+    """
+    
+    
+    
+    def __init__(self, boxes, items=None, leafSize=4):
+        """
+        :Parameters:
+        boxes : sequence
+            the boxes to index
+        items : sequence or None
+            the objects returned by the queries for each box; if None, the box indices are returned
+        leafSize : int
+            the maximum number of boxes held by a leaf of the tree
+        """
+    
+        pass
+    
+    
+    def __len__(self):
+        pass
+    
+    
+    def bounds(self):
+        """
+        Returns the (min, max) corners of the box enclosing all the boxes of the tree
+        """
+    
+        pass
+    
+    
+    def nearest(self, point, count=1):
+        """
+        Returns the item whose box is closest to point or, if count is greater than 1, a list of the
+        count closest items, closest first
+        """
+    
+        pass
+    
+    
+    def overlapping(self, box, tol=0.0):
+        """
+        Returns the items whose boxes overlap the given box, within tol
+        """
+    
+        pass
+    
+    
+    def overlappingPairs(self, other=None, tol=0.0):
+        """
+        Returns the pairs of overlapping items of this tree, or, if other is given, the (item,
+        otherItem) pairs of overlapping boxes between this tree and the other one
+        """
+    
+        pass
+    
+    
+    def raycast(self, origin, direction, maxDistance=None):
+        """
+        Returns the items whose boxes are hit by the ray, ordered by the distance from origin at which
+        the ray enters them
+        """
+    
+        pass
+    
+    
+    __dict__ = None
+    
+    __weakref__ = None
+
+
+
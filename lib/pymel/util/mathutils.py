@@ -1,3 +1,13 @@
+"""
+Scalar math functions, and their whole-buffer versions (the *Buffer functions, listed in
+bufferFunctions).
+
+Buffers can be numpy arrays, array.array('d') instances or any other sequences of floats.
+Scalar arguments are broadcast over the buffers. The computation is done by numpy when it is
+available, and with a single loop over the flat buffers otherwise; the result is of the same
+kind as the first buffer argument, or is written into out if it is given.
+"""
+
 import math
 
 from __builtin__ import round as _round
@@ -14,6 +24,15 @@ def blend(a, b, weight=0.5):
     pass
 
 
+def blendBuffer(a, b, weight=0.5, out=None):
+    """
+    blendBuffer(a, b[, weight=0.5[, out=None]]) :
+    Whole-buffer version of blend
+    """
+
+    pass
+
+
 def hermite(x=0.0, v0=0.0, v1=0.0, s0=0.0, s1=0.0):
     """
     As the MEL command : This command returns x point along on x hermite curve from the five given control arguments.
@@ -29,6 +48,15 @@ def hermite(x=0.0, v0=0.0, v1=0.0, s0=0.0, s1=0.0):
     pass
 
 
+def hermiteBuffer(x, v0, v1, s0, s1, out=None):
+    """
+    hermiteBuffer(x, v0, v1, s0, s1[, out=None]) :
+    Whole-buffer version of hermite
+    """
+
+    pass
+
+
 def round(value, ndigits=0):
     """
     round(number[, ndigits]) -> float
@@ -77,6 +105,15 @@ def smoothmap(min, max, x):
     pass
 
 
+def smoothmapBuffer(min, max, x, out=None):
+    """
+    smoothmapBuffer(min, max, x[, out=None]) :
+    Whole-buffer version of smoothmap
+    """
+
+    pass
+
+
 def clamp(x=0.0, min=0.0, max=1.0):
     """
     Clamps the value x between min and max
@@ -87,6 +124,15 @@ def clamp(x=0.0, min=0.0, max=1.0):
     pass
 
 
+def clampBuffer(x, min=0.0, max=1.0, out=None):
+    """
+    clampBuffer(x[, min=0.0[, max=1.0[, out=None]]]) :
+    Whole-buffer version of clamp
+    """
+
+    pass
+
+
 def conjugate(x):
     """
     the conjugate part of x
@@ -116,6 +162,15 @@ def smoothstep(min, max, x):
     pass
 
 
+def smoothstepBuffer(min, max, x, out=None):
+    """
+    smoothstepBuffer(min, max, x[, out=None]) :
+    Whole-buffer version of smoothstep
+    """
+
+    pass
+
+
 def real(x):
     """
     the real part of x
@@ -134,6 +189,15 @@ def setRange(x=0.0, oldmin=0.0, oldmax=1.0, newmin=0.0, newmax=1.0):
     pass
 
 
+def setRangeBuffer(x, oldmin=0.0, oldmax=1.0, newmin=0.0, newmax=1.0, out=None):
+    """
+    setRangeBuffer(x[, oldmin=0.0[, oldmax=1.0[, newmin=0.0[, newmax=1.0[, out=None]]]]]) :
+    Whole-buffer version of setRange
+    """
+
+    pass
+
+
 def linstep(min, max, x):
     """
     Returns the value of a linear step function.
@@ -147,6 +211,15 @@ def linstep(min, max, x):
     pass
 
 
+def linstepBuffer(min, max, x, out=None):
+    """
+    linstepBuffer(min, max, x[, out=None]) :
+    Whole-buffer version of linstep
+    """
+
+    pass
+
+
 def hermiteInterp(x=0.0, y0=0.0, y1=1.0, s0=0.0, s1=0.0):
     """
     Hermite interpolation of x between points y0 and y1 of tangent slope s0 and s1
@@ -158,3 +231,17 @@ def hermiteInterp(x=0.0, y0=0.0, y1=1.0, s0=0.0, s1=0.0):
 
 
 
+
+def hermiteInterpBuffer(x, y0, y1, s0, s1, out=None):
+    """
+    hermiteInterpBuffer(x, y0, y1, s0, s1[, out=None]) :
+    Whole-buffer version of hermiteInterp
+    """
+
+    pass
+
+
+
+bufferFunctions = {}
+
+
@@ -1,5 +1,9 @@
 import gzip
 import cPickle as pickle
+import collections
+import mmap
+import struct
+import zlib
 
 def _loads(filename):
     """
@@ -25,4 +29,216 @@ def load(filename):
     pass
 
 
+def dumpIndexed(data, filename, protocol=-1):
+    """
+    Save a dictionary, tuple or list to disk in the indexed format read by `loadIndexed`.
+    
+    The file starts with a header table giving, for every key, the offset and size of its value;
+    each value is pickled and zlib-compressed on its own. Values which are themselves dictionaries
+    are indexed one level further, so that their items can also be decoded one at a time.
+    
+    A tuple or list is indexed by position, the keys being 0 to len(data) - 1, and the header
+    records the type of data, so that `IndexedPickle.asTuple` can rebuild the sequence.
+    """
+
+    pass
+
+
+def detachIndexed(filename):
+    """
+    Detach the open IndexedPickle of filename, if any, so that the file can be overwritten
+    """
+
+    pass
+
+
+def isIndexed(filename):
+    """
+    Returns True if filename was written by `dumpIndexed`
+    """
+
+    pass
+
+
+def loadIndexed(filename):
+    """
+    Open a file written by `dumpIndexed`.
+    
+    Only the header table is read: the file is memory-mapped and returned as an `IndexedPickle`,
+    whose values are decoded the first time they are accessed. If a tuple or list was saved, its
+    items are the values of keys 0 to n - 1, and `IndexedPickle.asTuple` returns them as a tuple.
+    """
+
+    pass
+
+
+class IndexedPickle(object):
+    """
+    Read-only mapping over a memory-mapped file written by `dumpIndexed`.
+    
+    Values are decompressed and unpickled on first access, then kept; values that were stored as
+    dictionaries are returned as `LazyDict` instances, which defer decoding in turn to each of
+    their own items.
+    
+    While the map is open the file cannot be replaced on Windows. Before pymel writes a cache
+    file, its IndexedPickle, if any, is therefore detached (see detach and `detachIndexed`): the
+    compressed bytes of the entries not decoded yet are copied into memory and the map is
+    closed, so lazy decoding goes on from the copies.
+    """
+    
+    
+    
+    def __contains__(self, key):
+        pass
+    
+    
+    def __getitem__(self, key):
+        pass
+    
+    
+    def __init__(self, filename):
+        pass
+    
+    
+    def __iter__(self):
+        pass
+    
+    
+    def __len__(self):
+        pass
+    
+    
+    def asTuple(self):
+        """
+        Returns the data of a file saved from a tuple or list, as a tuple of the same length; every item
+        is decoded in turn, items saved as dictionaries being decoded into plain dicts.  Raises TypeError
+        if a dictionary was saved
+        """
+    
+        pass
+    
+    
+    def close(self):
+        """
+        Release the memory map; values that were not decoded yet can no longer be accessed
+        """
+    
+        pass
+    
+    
+    def detach(self):
+        """
+        Copy the compressed bytes of all the entries not decoded yet, including those of its
+        LazyDict values, into memory, then close the memory map, so that the file can be
+        replaced while the values remain available
+        """
+    
+        pass
+    
+    
+    def get(self, key, default=None):
+        pass
+    
+    
+    def keys(self):
+        pass
+    
+    
+    __dict__ = None
+    
+    __weakref__ = None
+
+
+class LazyDict(collections.MutableMapping):
+    """
+    A mapping whose values are decoded from an `IndexedPickle` the first time they are accessed.
+    
+    LazyDict is deliberately not a dict subclass: the C implementation of dict reads the storage
+    of dict subclasses directly, bypassing overridden methods, so dict(x), d.update(x), f(**x) and
+    C code calling PyDict_GetItem would see missing or undecoded values. As a
+    collections.MutableMapping, it is only ever accessed through its methods, which all the above
+    use for non-dict mappings.
+    
+    The keys are all known up front, so membership tests and iteration over the keys never decode
+    anything. Decoded values are kept in a plain dict; setting or deleting items works as for a
+    dict, and copy returns a plain dict with all the values decoded.
+    """
+    
+    
+    
+    def __contains__(self, key):
+        pass
+    
+    
+    def __delitem__(self, key):
+        pass
+    
+    
+    def __getitem__(self, key):
+        pass
+    
+    
+    def __init__(self, source, offsets):
+        pass
+    
+    
+    def __iter__(self):
+        pass
+    
+    
+    def __len__(self):
+        pass
+    
+    
+    def __reduce__(self):
+        """
+        Pickles as a plain dict, with all the values decoded
+        """
+    
+        pass
+    
+    
+    def __repr__(self):
+        pass
+    
+    
+    def __setitem__(self, key, value):
+        pass
+    
+    
+    def copy(self):
+        """
+        Returns a plain dict holding all the items, decoding the remaining values first
+        """
+    
+        pass
+    
+    
+    def decodeAll(self):
+        """
+        Decode all the values not decoded yet
+        """
+    
+        pass
+    
+    
+    def detach(self):
+        """
+        Copy the compressed bytes of the values not decoded yet out of the memory map of the source
+        `IndexedPickle`, so that they stay available after it is closed
+        """
+    
+        pass
+    
+    
+    def keys(self):
+        pass
+    
+    
+    __abstractmethods__ = frozenset()
+
+
+
+INDEX_MAGIC = 'PMIDX\x00\x01\x00'
 
+_openIndexed = {}
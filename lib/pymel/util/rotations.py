@@ -0,0 +1,149 @@
+"""
+Batch conversion kernels between euler rotations, quaternions and rotation matrices.
+
+The six rotate orders are indexed as in MEulerRotation and the rotateOrder attribute, see
+ROTATE_ORDERS. Each of them is reduced to a permutation of the axes and a parity, precomputed in
+lookup tables, so that a single kernel handles all the orders and the per rotation work is only
+arithmetic: whole arrays of rotations can be converted without going through the api one
+rotation at a time.
+
+Rotation buffers are flat sequences of floats (numpy arrays, array.array('d') instances or
+lists): 3 angles in radians per euler rotation, 4 components (x, y, z, w) per quaternion and
+16 per matrix. The computation is done by numpy when it is available, and with a single loop
+over the flat buffers otherwise; the result is of the same kind as the first buffer argument,
+or is written into out if it is given.
+"""
+
+import math
+
+def eulerToMatrix(rotations, order=0, out=None):
+    """
+    eulerToMatrix(rotations[, order=0[, out=None]]) :
+    Converts every euler rotation of the buffer, in the given rotate order, to a rotation matrix
+    """
+
+    pass
+
+
+def eulerToQuaternion(rotations, order=0, out=None):
+    """
+    eulerToQuaternion(rotations[, order=0[, out=None]]) :
+    Converts every euler rotation of the buffer, in the given rotate order, to a quaternion
+    """
+
+    pass
+
+
+def filterEuler(rotations, order=0, previous=None, out=None):
+    """
+    filterEuler(rotations[, order=0[, previous=None[, out=None]]]) :
+    Removes the flips of a curve of euler rotations: each rotation is replaced by the equivalent
+    rotation, 2*pi offsets and gimbal flips included, closest to the one before it. previous is
+    the last filtered rotation of the preceding part of the curve, if any; see EulerFilter to
+    filter a curve in several chunks
+    """
+
+    pass
+
+
+def matrixToEuler(matrices, order=0, out=None):
+    """
+    matrixToEuler(matrices[, order=0[, out=None]]) :
+    Converts every rotation matrix of the buffer to an euler rotation in the given rotate order
+    """
+
+    pass
+
+
+def matrixToQuaternion(matrices, out=None):
+    """
+    matrixToQuaternion(matrices[, out=None]) :
+    Converts every rotation matrix of the buffer to a quaternion
+    """
+
+    pass
+
+
+def quaternionToEuler(quaternions, order=0, out=None):
+    """
+    quaternionToEuler(quaternions[, order=0[, out=None]]) :
+    Converts every quaternion of the buffer to an euler rotation in the given rotate order
+    """
+
+    pass
+
+
+def quaternionToMatrix(quaternions, out=None):
+    """
+    quaternionToMatrix(quaternions[, out=None]) :
+    Converts every quaternion of the buffer to a rotation matrix
+    """
+
+    pass
+
+
+def reorderEuler(rotations, fromOrder, toOrder, out=None):
+    """
+    reorderEuler(rotations, fromOrder, toOrder[, out=None]) :
+    Expresses every euler rotation of the buffer, given in the rotate order fromOrder, in the
+    rotate order toOrder
+    """
+
+    pass
+
+
+def rotateOrderIndex(order):
+    """
+    rotateOrderIndex(order) :
+    Returns the index in ROTATE_ORDERS of a rotate order given by name ('XYZ', 'yzx', ...) or
+    index
+    """
+
+    pass
+
+
+class EulerFilter(object):
+    """
+    Streaming version of filterEuler, for curves too long to be held in memory or produced chunk by
+    chunk, eg. frame ranges of a take being retargeted.
+    
+    The filter keeps the last rotation it returned, so that filtering a curve in several calls
+    gives the same result as filtering it in one.
+    
+        >>> f = EulerFilter(order='XYZ')
+        >>> chunk = f.filter([0.0, 0.0, 3.1, 0.0, 0.0, -3.1])
+        >>> [round(x, 2) for x in chunk]
+        [0.0, 0.0, 3.1, 0.0, 0.0, 3.18]
+    """
+    
+    
+    
+    def __init__(self, order=0, previous=None):
+        pass
+    
+    
+    def filter(self, rotations, out=None):
+        """
+        Filters the next chunk of the curve, a buffer of euler rotations, and returns it
+        """
+    
+        pass
+    
+    
+    def reset(self, previous=None):
+        """
+        Starts a new curve
+        """
+    
+        pass
+    
+    
+    __dict__ = None
+    
+    __weakref__ = None
+
+
+
+ROTATE_ORDERS = ('XYZ', 'YZX', 'ZXY', 'XZY', 'YXZ', 'ZYX')
+
+_orderTables = ()